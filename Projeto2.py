@@ -1,86 +1,337 @@
+import argparse
+import csv
+import importlib
+import io
+import json
+import math
+import os
 import sys
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import redirect_stdout
+from functools import lru_cache
+from heapq import heappop, heappush
+from itertools import islice
+from operator import mul
+
+
+
+# ============================================================
+#  CARREGAMENTO SOB DEMANDA DAS BIBLIOTECAS PESADAS
+# ============================================================
+
+class LazyModule:
+    """
+    Substituto de um módulo que só é importado no primeiro acesso a um
+    atributo. Depois disso, os atributos do módulo são copiados para a
+    instância, e os acessos seguintes não passam mais por __getattr__.
+    """
+
+    def __init__(self, nome):
+        self.__dict__["_nome"] = nome
+
+    def __getattr__(self, atributo):
+        modulo = importlib.import_module(self._nome)
+        self.__dict__.update(vars(modulo))
+        return getattr(modulo, atributo)
+
+    def __repr__(self):
+        return f"<LazyModule {self._nome!r}>"
+
+
+
+def lazy_import(nome):
+    """
+    Módulo já importado é devolvido direto; caso contrário, um
+    LazyModule que importa nome no primeiro uso.
+    """
+
+    return sys.modules.get(nome) or LazyModule(nome)
+
+
+
+np = lazy_import("numpy")
 
 # ============================================================
 #  MÉTODO DIRETO – ELIMINAÇÃO DE GAUSS (TÓPICO 1 QUESTÃO 2)
 # ============================================================
 
-def gauss_elimination(A, b, return_steps=False):
+def _pivot_rows(A, k):
     """
-    Função que resolve sistemas lineares usando
-    a Eliminação de Gauss com pivoteamento parcial.
-    Se return_steps=True, retorna também o histórico detalhado.
+    Pivoteamento parcial: índice da linha com o maior |A[i][k]|, i ≥ k.
+    Funciona tanto para uma matriz (n, n) quanto para uma pilha (m, n, n),
+    caso em que retorna um índice por sistema.
     """
 
-    # Número de equações
-    n = len(b)
+    return k + np.argmax(np.abs(A[..., k:, k]), axis=-1)
 
-    # Realizamos cópias para evitar alterar os dados originais
-    A = [row[:] for row in A]
-    b = b[:]
 
-    # Lista de passos caso o usuário deseje ver explicação
-    steps = [] if return_steps else None
 
-    try:
-        # ------------------------------
-        # FASE DE ELIMINAÇÃO PROGRESSIVA
-        # ------------------------------
+class LUFactorization:
+    """
+    Fatoração PA = LU com pivoteamento parcial, calculada uma única vez.
+
+    A eliminação (O(n³)) acontece no construtor; depois disso cada
+    solve(b) custa apenas O(n²) (substituições progressiva e regressiva),
+    o que é ideal quando a matriz é fixa e o vetor b muda muitas vezes.
+
+    engine="numpy" usa atualizações de posto 1 vetorizadas;
+    engine="python" usa a implementação de referência em listas.
+    Se steps for uma lista, os passos da eliminação são registrados nela.
+    """
+
+    def __init__(self, A, engine="numpy", steps=None):
+        if engine not in ("numpy", "python"):
+            raise ValueError(f"Motor desconhecido: {engine!r} (use 'numpy' ou 'python').")
+
+        self.engine = engine
+        self.n = len(A)
+
+        if engine == "numpy":
+            self._factor_numpy(A, steps)
+        else:
+            self._factor_python(A, steps)
+
+    # ------------------------------
+    # FASE DE ELIMINAÇÃO PROGRESSIVA
+    # ------------------------------
+
+    def _factor_python(self, A, steps):
+        n = self.n
+
+        # Cópia para evitar alterar os dados originais.
+        # Os multiplicadores ficam guardados abaixo da diagonal (forma compacta).
+        LU = [list(row) for row in A]
+        perm = list(range(n))
+
         for k in range(n):
 
             # Seleção do maior pivô da coluna (pivoteamento parcial)
-            max_row = max(range(k, n), key=lambda i: abs(A[i][k]))
+            max_row = max(range(k, n), key=lambda i: abs(LU[i][k]))
 
             # Se necessário, troca a linha atual pela linha com maior pivô
             if max_row != k:
-                A[k], A[max_row] = A[max_row], A[k]
-                b[k], b[max_row] = b[max_row], b[k]
+                LU[k], LU[max_row] = LU[max_row], LU[k]
+                perm[k], perm[max_row] = perm[max_row], perm[k]
 
-                if return_steps:
+                if steps is not None:
                     steps.append(f"Passo {k+1}: Troca das linhas {k+1} ↔ {max_row+1} para melhorar o pivô.")
 
             # Verificação de pivô nulo (sistema singular)
-            if A[k][k] == 0:
+            if LU[k][k] == 0:
                 raise ValueError("Sistema singular – divisão por zero no pivô.")
 
-            # Explicação do passo atual
-            if return_steps:
+            if steps is not None:
                 steps.append(f"Passo {k+1}: Eliminação dos elementos abaixo do pivô na coluna {k+1}.")
 
             # Eliminação das linhas abaixo do pivô
             for i in range(k+1, n):
                 # Cálculo do multiplicador
-                m = A[i][k] / A[k][k]
+                m = LU[i][k] / LU[k][k]
 
-                if return_steps:
+                if steps is not None:
                     steps.append(f"  → L{i+1} = L{i+1} - ({m:.4f}) × L{k+1}")
 
                 # Subtração da linha k multiplicada pelo fator m
-                for j in range(k, n):
-                    A[i][j] -= m * A[k][j]
+                for j in range(k+1, n):
+                    LU[i][j] -= m * LU[k][j]
 
-                # Ajuste correspondente no vetor b
-                b[i] -= m * b[k]
+                LU[i][k] = m
 
-        # ------------------------------
-        # FASE DE SUBSTITUIÇÃO REGRESSIVA
-        # ------------------------------
+        self._lu = LU
+        self._perm = perm
+
+    def _factor_numpy(self, A, steps):
+        n = self.n
+
+        # np.array sempre copia, preservando os dados originais
+        LU = np.array(A, dtype=float)
+        perm = np.arange(n)
+
+        for k in range(n):
+
+            # Maior pivô da coluna k (pivoteamento parcial)
+            max_row = int(_pivot_rows(LU, k))
+
+            if max_row != k:
+                LU[[k, max_row]] = LU[[max_row, k]]
+                perm[[k, max_row]] = perm[[max_row, k]]
+
+                if steps is not None:
+                    steps.append(f"Passo {k+1}: Troca das linhas {k+1} ↔ {max_row+1} para melhorar o pivô.")
+
+            if LU[k, k] == 0:
+                raise ValueError("Sistema singular – divisão por zero no pivô.")
+
+            if steps is not None:
+                steps.append(f"Passo {k+1}: Eliminação dos elementos abaixo do pivô na coluna {k+1}.")
+
+            # Multiplicadores de todas as linhas abaixo do pivô de uma vez
+            m = LU[k+1:, k] / LU[k, k]
+
+            if steps is not None:
+                for i, mi in enumerate(m, start=k+1):
+                    steps.append(f"  → L{i+1} = L{i+1} - ({mi:.4f}) × L{k+1}")
+
+            # Atualização de posto 1 do bloco inferior direito
+            LU[k+1:, k+1:] -= np.outer(m, LU[k, k+1:])
+            LU[k+1:, k] = m
+
+        self._lu = LU
+        self._perm = perm
+
+    # ------------------------------
+    # FATORES
+    # ------------------------------
+
+    @property
+    def perm(self):
+        """Permutação das linhas: A[perm] = L · U."""
+        return list(self._perm)
+
+    @property
+    def L(self):
+        """Matriz triangular inferior com diagonal unitária."""
+        n = self.n
+        if self.engine == "numpy":
+            return np.tril(self._lu, -1) + np.eye(n)
+        return [[self._lu[i][j] if j < i else float(i == j) for j in range(n)]
+                for i in range(n)]
+
+    @property
+    def U(self):
+        """Matriz triangular superior obtida na eliminação."""
+        n = self.n
+        if self.engine == "numpy":
+            return np.triu(self._lu)
+        return [[self._lu[i][j] if j >= i else 0.0 for j in range(n)]
+                for i in range(n)]
+
+    # ------------------------------
+    # SUBSTITUIÇÕES – O(n²) POR VETOR
+    # ------------------------------
+
+    def solve(self, b, steps=None):
+        """
+        Resolve Ax = b reaproveitando a fatoração.
+        Retorna ndarray (motor numpy) ou lista (motor python).
+        """
+
+        if len(b) != self.n:
+            raise ValueError(f"O vetor b deve conter {self.n} valores.")
+
+        if self.engine == "numpy":
+            return self._solve_numpy(b, steps)
+        return self._solve_python(b, steps)
+
+    def solve_many(self, B):
+        """
+        Resolve AX = B para uma matriz B (n × k) de lados direitos.
+        No motor numpy as k colunas são substituídas juntas.
+        """
+
+        if self.engine == "numpy":
+            B = np.asarray(B, dtype=float)
+            if B.ndim != 2 or B.shape[0] != self.n:
+                raise ValueError(f"B deve ter formato ({self.n}, k).")
+            return self._solve_numpy(B, None)
+
+        if len(B) != self.n:
+            raise ValueError(f"B deve ter {self.n} linhas.")
+        colunas = [self._solve_python([row[j] for row in B], None)
+                   for j in range(len(B[0]))]
+        return [list(row) for row in zip(*colunas)]
+
+    def _solve_python(self, b, steps):
+        n = self.n
+        LU = self._lu
+
+        # Substituição progressiva: Ly = Pb
+        y = [b[p] for p in self._perm]
+        for i in range(1, n):
+            for j in range(i):
+                y[i] -= LU[i][j] * y[j]
+
+        # Substituição regressiva: Ux = y
         x = [0] * n
 
-        if return_steps:
+        if steps is not None:
             steps.append("Iniciando substituição regressiva...")
 
         # Começa pela última equação
         for i in range(n-1, -1, -1):
-            s = sum(A[i][j] * x[j] for j in range(i+1, n))
-            x[i] = (b[i] - s) / A[i][i]
+            s = sum(LU[i][j] * x[j] for j in range(i+1, n))
+            x[i] = (y[i] - s) / LU[i][i]
+
+            if steps is not None:
+                steps.append(f"  x{i+1} = ({y[i]:.4f} - {s:.4f}) / {LU[i][i]:.4f} = {x[i]:.4f}")
+
+        return x
+
+    def _solve_numpy(self, b, steps):
+        n = self.n
+        LU = self._lu
+
+        # Substituição progressiva: Ly = Pb (b pode ser vetor ou bloco n × k)
+        y = np.asarray(b, dtype=float)[self._perm]
+        for i in range(1, n):
+            y[i] -= LU[i, :i] @ y[:i]
+
+        # Substituição regressiva: Ux = y
+        x = np.zeros_like(y)
+
+        if steps is not None:
+            steps.append("Iniciando substituição regressiva...")
+
+        for i in range(n-1, -1, -1):
+            s = LU[i, i+1:] @ x[i+1:]
+            x[i] = (y[i] - s) / LU[i, i]
+
+            if steps is not None:
+                steps.append(f"  x{i+1} = ({y[i]:.4f} - {s:.4f}) / {LU[i, i]:.4f} = {x[i]:.4f}")
+
+        return x
+
 
+
+def gauss_elimination(A, b, return_steps=False, engine="numpy"):
+    """
+    Função que resolve sistemas lineares usando
+    a Eliminação de Gauss com pivoteamento parcial.
+    Se return_steps=True, retorna também o histórico detalhado.
+
+    engine="numpy" usa o motor vetorizado; engine="python" usa a
+    implementação de referência com laços em Python puro.
+    Internamente é construída uma LUFactorization; para vários
+    vetores b com a mesma matriz, use a fatoração diretamente.
+
+    b também pode ser um bloco n × k (lista de listas ou ndarray 2D):
+    a eliminação é feita uma única vez e as k colunas são resolvidas
+    juntas, retornando x no mesmo formato n × k.
+    """
+
+    # Lista de passos caso o usuário deseje ver explicação
+    steps = [] if return_steps else None
+
+    try:
+        lu = LUFactorization(A, engine=engine, steps=steps)
+
+        if np.ndim(b) == 2:
+            # Bloco de lados direitos: todas as colunas em uma passada
             if return_steps:
-                steps.append(f"  x{i+1} = ({b[i]:.4f} - {s:.4f}) / {A[i][i]:.4f} = {x[i]:.4f}")
+                steps.append(f"Iniciando substituição regressiva para as {len(b[0])} colunas de b simultaneamente...")
+            x = lu.solve_many(b)
+        else:
+            x = lu.solve(b, steps=steps)
+
+        if engine == "numpy":
+            x = x.tolist()
 
         # Retorna solução + passos, se solicitado
         if return_steps:
             return x, steps
-        
+
         return x
 
     except Exception as e:
@@ -89,6 +340,79 @@ def gauss_elimination(A, b, return_steps=False):
 
 
 
+def gauss_elimination_batch(A, b):
+    """
+    Resolve de uma só vez m sistemas pequenos e independentes
+    A[s] x[s] = b[s], com A de formato (m, n, n) e b de formato (m, n).
+
+    A eliminação com pivoteamento parcial é feita coluna a coluna para
+    a pilha inteira, com operações vetorizadas, evitando o custo de
+    chamar gauss_elimination m vezes. Retorna x com formato (m, n);
+    sistemas singulares recebem NaN em vez de interromper o lote.
+    """
+
+    try:
+        A = np.array(A, dtype=float)
+        b = np.array(b, dtype=float)
+
+        if A.ndim != 3 or A.shape[1] != A.shape[2]:
+            raise ValueError("A deve ter formato (m, n, n).")
+        if b.shape != A.shape[:2]:
+            raise ValueError("b deve ter formato (m, n).")
+
+        m, n, _ = A.shape
+        sistemas = np.arange(m)
+        singular = np.zeros(m, dtype=bool)
+
+        # ------------------------------
+        # FASE DE ELIMINAÇÃO PROGRESSIVA
+        # ------------------------------
+        for k in range(n):
+
+            # Mesmo critério de pivô de gauss_elimination, um por sistema
+            max_row = _pivot_rows(A, k)
+
+            # Troca das linhas k ↔ max_row em todos os sistemas
+            linha_k = A[sistemas, k].copy()
+            A[sistemas, k] = A[sistemas, max_row]
+            A[sistemas, max_row] = linha_k
+
+            b_k = b[sistemas, k].copy()
+            b[sistemas, k] = b[sistemas, max_row]
+            b[sistemas, max_row] = b_k
+
+            # Pivôs nulos marcam o sistema como singular; o pivô é
+            # trocado por 1 só para não contaminar o restante do lote
+            pivo = A[:, k, k]
+            nulo = pivo == 0
+            singular |= nulo
+            pivo = np.where(nulo, 1.0, pivo)
+
+            # Multiplicadores (m, n-k-1) e atualização de posto 1 por sistema
+            mult = A[:, k+1:, k] / pivo[:, None]
+            A[:, k+1:, k:] -= mult[:, :, None] * A[:, None, k, k:]
+            b[:, k+1:] -= mult * b[:, k, None]
+
+        # ------------------------------
+        # FASE DE SUBSTITUIÇÃO REGRESSIVA
+        # ------------------------------
+        diag = np.diagonal(A, axis1=1, axis2=2)
+        diag = np.where(diag == 0, 1.0, diag)
+        x = np.zeros((m, n))
+
+        for i in range(n-1, -1, -1):
+            s = np.einsum("mj,mj->m", A[:, i, i+1:], x[:, i+1:])
+            x[:, i] = (b[:, i] - s) / diag[:, i]
+
+        x[singular] = np.nan
+        return x
+
+    except Exception as e:
+        print("Erro na eliminação de Gauss em lote:", e)
+        return None
+
+
+
 def modulo_topico1_questao2():
     """
     Módulo interativo que resolve o sistema da Questão 2 usando
@@ -145,49 +469,804 @@ def modulo_topico1_questao2():
 #  GAUSS-SEIDEL – TÓPICO 2 QUESTÃO 3
 # ============================================================
 
-def gauss_seidel(A, b, x0, tol=1e-4, max_iter=1000):
+class CSRMatrix:
+    """
+    Matriz esparsa no formato CSR (Compressed Sparse Row).
+
+    Guarda apenas os elementos não nulos: data (valores), indices
+    (colunas) e indptr (início de cada linha em data/indices).
+    Matrizes de malhas de circuitos têm poucos não nulos por linha,
+    então a memória e o custo de cada varredura ficam O(nnz).
+    """
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = tuple(shape)
+
+        if len(self.indptr) != self.shape[0] + 1:
+            raise ValueError("indptr deve ter n_linhas + 1 posições.")
+        if len(self.data) != len(self.indices):
+            raise ValueError("data e indices devem ter o mesmo tamanho.")
+
+        self._rows = None
+
+    @classmethod
+    def from_dense(cls, A):
+        """Constrói a matriz CSR a partir de uma matriz densa."""
+        A = np.asarray(A, dtype=float)
+        linhas, colunas = np.nonzero(A)
+        indptr = np.concatenate(([0], np.cumsum(np.count_nonzero(A, axis=1))))
+        return cls(A[linhas, colunas], colunas, indptr, A.shape)
+
+    @classmethod
+    def from_triplets(cls, rows, cols, vals, shape):
+        """
+        Constrói a matriz CSR a partir de triplas (linha, coluna, valor).
+        Entradas repetidas na mesma posição são somadas, como ao
+        acumular as resistências de cada malha.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        vals = np.asarray(vals, dtype=float)
+
+        # Ordena por (linha, coluna) e soma as duplicatas
+        ordem = np.lexsort((cols, rows))
+        rows, cols, vals = rows[ordem], cols[ordem], vals[ordem]
+        novo = np.ones(len(rows), dtype=bool)
+        novo[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+        grupo = np.cumsum(novo) - 1
+        vals = np.bincount(grupo, weights=vals) if len(vals) else vals
+        rows, cols = rows[novo], cols[novo]
+
+        contagem = np.bincount(rows, minlength=shape[0])
+        indptr = np.concatenate(([0], np.cumsum(contagem)))
+        return cls(vals, cols, indptr, shape)
+
+    @property
+    def nnz(self):
+        """Número de elementos não nulos armazenados."""
+        return len(self.data)
+
+    def __len__(self):
+        return self.shape[0]
+
+    def diagonal(self):
+        """Vetor com a diagonal principal (zeros onde não há entrada)."""
+        n = min(self.shape)
+        diag = np.zeros(n)
+        linhas = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        na_diag = linhas == self.indices
+        diag[linhas[na_diag]] = self.data[na_diag]
+        return diag
+
+    def matvec(self, x):
+        """Produto A·x em O(nnz)."""
+        x = np.asarray(x, dtype=float)
+        linhas = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return np.bincount(linhas, weights=self.data * x[self.indices],
+                           minlength=self.shape[0])
+
+    def __matmul__(self, x):
+        return self.matvec(x)
+
+    def to_dense(self):
+        """Converte para ndarray denso (apenas para matrizes pequenas)."""
+        A = np.zeros(self.shape)
+        linhas = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        A[linhas, self.indices] = self.data
+        return A
+
+    def _gs_rows(self):
+        """
+        Linhas fora da diagonal em listas Python (colunas, valores) e a
+        diagonal, preparadas uma única vez para as varreduras iterativas.
+        """
+        if self._rows is None:
+            data = self.data.tolist()
+            indices = self.indices.tolist()
+            indptr = self.indptr.tolist()
+            fora = []
+            diag = []
+            for i in range(self.shape[0]):
+                cols, vals, d = [], [], 0.0
+                for p in range(indptr[i], indptr[i+1]):
+                    if indices[p] == i:
+                        d += data[p]
+                    else:
+                        cols.append(indices[p])
+                        vals.append(data[p])
+                fora.append((cols, vals))
+                diag.append(d)
+            self._rows = (fora, diag)
+        return self._rows
+
+
+
+class IterationHistory:
+    """
+    Histórico de iterações com memória controlada.
+
+    every=N guarda apenas uma a cada N iterações (a última iteração é
+    sempre guardada pelo método). size=M usa um buffer circular
+    pré-alocado com as M entradas mais recentes, sem nenhuma alocação
+    durante as iterações; size=None guarda todas as entradas registradas.
+    """
+
+    def __init__(self, n, every=1, size=None):
+        if every < 1:
+            raise ValueError("every deve ser ≥ 1.")
+        if size is not None and size < 1:
+            raise ValueError("size deve ser ≥ 1.")
+
+        self.n = n
+        self.every = every
+        self.size = size
+        self._count = 0
+
+        if size is None:
+            self._entries = []
+        else:
+            self._k = np.zeros(size, dtype=np.int64)
+            self._x = np.zeros((size, n))
+            self._err = np.zeros(size)
+
+    def record(self, k, x, err, force=False):
+        """Registra a iteração k, respeitando o intervalo every."""
+        if not force and k % self.every != 0:
+            return
+        if self._count and self._last_k() == k:
+            return
+
+        if self.size is None:
+            self._entries.append((k, np.array(x, dtype=float), err))
+        else:
+            slot = self._count % self.size
+            self._k[slot] = k
+            self._x[slot, :] = x
+            self._err[slot] = err
+
+        self._count += 1
+
+    def _last_k(self):
+        if self.size is None:
+            return self._entries[-1][0]
+        return self._k[(self._count - 1) % self.size]
+
+    def __len__(self):
+        return self._count if self.size is None else min(self._count, self.size)
+
+    def entries(self):
+        """Lista cronológica de tuplas (iteração, x, erro)."""
+        if self.size is None:
+            return list(self._entries)
+
+        total = len(self)
+        inicio = self._count - total
+        slots = [(inicio + t) % self.size for t in range(total)]
+        return [(int(self._k[s]), self._x[s].copy(), float(self._err[s])) for s in slots]
+
+
+
+def gauss_seidel_sweep(A, b, x, omega=1.0):
+    """
+    Executa UMA varredura de Gauss-Seidel, atualizando x no próprio lugar.
+
+    Como x[j] ainda guarda o valor antigo para j > i, não é preciso
+    copiar o vetor anterior: o erro max |xᵢ_novo - xᵢ_antigo| é medido
+    durante a própria varredura e retornado ao final.
+    A pode ser um ndarray denso (x deve ser ndarray) ou uma CSRMatrix
+    (x pode ser lista ou ndarray). Com omega ≠ 1 a varredura é de SOR:
+    xᵢ_novo = (1 - ω)·xᵢ_antigo + ω·xᵢ_GS.
+    """
+
+    erro = 0.0
+    resto = 1.0 - omega
+
+    if isinstance(A, CSRMatrix):
+        fora, diag = A._gs_rows()
+
+        for i in range(len(diag)):
+            cols, vals = fora[i]
+
+            # Apenas os não nulos da linha i
+            s = sum(map(mul, vals, map(x.__getitem__, cols)))
+            novo = resto * x[i] + omega * (b[i] - s) / diag[i]
+
+            erro = max(erro, abs(novo - x[i]))
+            x[i] = novo
+
+        return erro
+
+    diag = np.diagonal(A)
+
+    for i in range(len(diag)):
+        # Produto da linha inteira, descontando o termo da diagonal
+        s = A[i] @ x - diag[i] * x[i]
+        novo = resto * x[i] + omega * (b[i] - s) / diag[i]
+
+        erro = max(erro, abs(novo - x[i]))
+        x[i] = novo
+
+    return erro
+
+
+
+class ConvergenceMonitor:
+    """
+    Acompanha o erro de um método iterativo e estima o fator de
+    contração assintótico ρ ≈ eₖ / eₖ₋₁ pela média geométrica das
+    razões nas últimas `window` iterações.
+
+    Se ρ ≥ 1 por `patience` iterações seguidas, depois das `grace`
+    primeiras e com o erro acima do da primeira iteração, o método é
+    declarado divergente (erro não finito encerra logo). Um erro que
+    apenas estaciona no nível do arredondamento não é divergência. Se
+    ρ < 1, remaining() prevê quantas iterações faltam para atingir a
+    tolerância.
+
+    Em matrizes não normais o erro pode crescer por até n iterações e
+    ainda assim convergir (ex.: bidiagonal superior, com raio espectral
+    de Gauss-Seidel nulo). Com grace=None, o método que usa o monitor
+    chama size_hint(n), que define grace = min(n, MAX_GRACE): a
+    carência não cresce com n, para que sistemas grandes divergentes
+    ainda sejam interrompidos cedo.
+    """
+
+    # Teto da carência inicial, independente do tamanho do sistema
+    MAX_GRACE = 50
+
+    def __init__(self, tol, window=5, patience=3, grace=None):
+        self.tol = tol
+        self.window = window
+        self.patience = patience
+        self.grace = grace
+
+        self.iterations = 0
+        self.error = None
+        self.factor = None
+        self.diverging = False
+
+        self._errors = deque(maxlen=window + 1)
+        self._growing = 0
+        self._first = None
+
+    def update(self, err):
+        """Registra o erro da iteração atual e retorna True se divergiu."""
+        self.iterations += 1
+        self.error = err
+
+        if not math.isfinite(err):
+            self.diverging = True
+            return True
+
+        if self._first is None:
+            self._first = err
+        self._errors.append(err)
+
+        if len(self._errors) == self._errors.maxlen and self._errors[0] > 0:
+            if err == 0:
+                self.factor = 0.0
+            else:
+                self.factor = (err / self._errors[0]) ** (1.0 / self.window)
+
+            if self.factor >= 1:
+                self._growing += 1
+                self.diverging = (self._growing >= self.patience
+                                  and self.iterations > (self.grace or 0)
+                                  and err > self._first)
+            else:
+                self._growing = 0
+
+        return self.diverging
+
+    def size_hint(self, n):
+        """Define a carência para um sistema n × n, se não foi informada."""
+        if self.grace is None:
+            self.grace = min(n, self.MAX_GRACE)
+
+    def remaining(self):
+        """
+        Iterações previstas até erro < tol, ou None se ainda não há
+        estimativa ou o método não está contraindo.
+        """
+        if self.error is None or self.error < self.tol:
+            return 0
+        if self.factor is None or self.factor >= 1:
+            return None
+        if self.factor == 0:
+            return 1
+        return math.ceil(math.log(self.tol / self.error) / math.log(self.factor))
+
+
+
+def _relaxation(A, b, x0, tol, max_iter, history, omega, monitor=None):
+    """
+    Laço comum de Gauss-Seidel (omega = 1) e SOR, denso ou esparso.
+    Retorna a solução e o número de iterações; erros são propagados.
+    Um ConvergenceMonitor interrompe a execução assim que a
+    divergência é detectada, em vez de gastar todas as max_iter varreduras.
+    """
+
+    if isinstance(A, CSRMatrix):
+        n = A.shape[0]
+        _, diag = A._gs_rows()
+
+        # Listas Python são mais rápidas na varredura elemento a elemento
+        b = [float(v) for v in b]
+        x = [float(v) for v in x0]
+    else:
+        A = np.asarray(A, dtype=float)
+        n = len(A)
+        diag = np.diagonal(A).tolist()
+        b = np.asarray(b, dtype=float)
+        x = np.array(x0, dtype=float)
+
+    if any(d == 0 for d in diag):
+        raise ValueError("Elemento nulo na diagonal.")
+    if len(b) != n or len(x) != n:
+        raise ValueError(f"b e x0 devem conter {n} valores.")
+
+    # Crescimento transitório do erro é tolerado nas primeiras iterações
+    if monitor is None:
+        monitor = ConvergenceMonitor(tol)
+    monitor.size_hint(n)
+
+    # Loop principal de iterações
+    for it in range(1, max_iter+1):
+
+        # Critério de parada: maior erro entre componentes
+        erro = gauss_seidel_sweep(A, b, x, omega)
+
+        divergiu = monitor.update(erro)
+
+        if history is not None:
+            history.record(it, x, erro, force=divergiu or erro < tol or it == max_iter)
+
+        if divergiu:
+            raise ValueError(f"Divergência detectada na iteração {it} "
+                             f"(fator de contração estimado: {monitor.factor or math.inf:.3f} ≥ 1).")
+
+        if erro < tol:
+            break
+    else:
+        # Caso não converja no limite de iterações
+        it = max_iter
+
+    return (x.tolist() if isinstance(x, np.ndarray) else x), it
+
+
+
+def gauss_seidel_sparse(A, b, x0, tol=1e-4, max_iter=1000, history=None, monitor=None):
+    """
+    Gauss-Seidel para matrizes CSRMatrix.
+    Cada varredura visita apenas os não nulos, custando O(nnz)
+    em vez de O(n²). Retorna a solução e o número de iterações.
+    """
+
+    try:
+        return _relaxation(A, b, x0, tol, max_iter, history, 1.0, monitor)
+
+    except Exception as e:
+        print("Erro no método de Gauss-Seidel esparso:", e)
+        return None, None
+
+
+
+def gauss_seidel(A, b, x0, tol=1e-4, max_iter=1000, history=None, monitor=None):
     """
     Implementação do método iterativo de Gauss-Seidel.
     Retorna a solução aproximada e o número de iterações.
+    Se A for uma CSRMatrix, usa a versão esparsa (gauss_seidel_sparse).
+
+    As varreduras são feitas no próprio vetor x, sem cópias por
+    iteração. Para acompanhar a convergência, passe um IterationHistory.
+    Se a divergência for detectada, retorna (None, None); passe um
+    ConvergenceMonitor para consultar o fator de contração e a previsão
+    de iterações restantes.
     """
 
-    n = len(b)
-    x = x0[:]
+    if isinstance(A, CSRMatrix):
+        return gauss_seidel_sparse(A, b, x0, tol, max_iter, history, monitor)
 
     try:
-        # Loop principal de iterações
-        for it in range(max_iter):
+        return _relaxation(A, b, x0, tol, max_iter, history, 1.0, monitor)
 
-            # Guarda o vetor anterior para medir erro
-            x_old = x.copy()
+    except Exception as e:
+        print("Erro no método de Gauss-Seidel:", e)
+        return None, None
 
-            # Atualiza cada variável usando os valores mais recentes
-            for i in range(n):
 
-                # Parte da soma que usa valores já atualizados
-                s1 = sum(A[i][j] * x[j] for j in range(i))
 
-                # Parte da soma que usa valores antigos
-                s2 = sum(A[i][j] * x_old[j] for j in range(i+1, n))
+def jacobi_spectral_radius(A, max_iter=200, tol=1e-6):
+    """
+    Estima o raio espectral ρ(J) da matriz de iteração de Jacobi
+    J = I - D⁻¹A pelo método das potências, sem montar J.
 
-                # Atualização da variável
-                x[i] = (b[i] - s1 - s2) / A[i][i]
+    Usa a razão de dois passos √(‖J²v‖/‖v‖), que converge mesmo quando
+    os autovalores dominantes são ±ρ (caso típico de matrizes simétricas).
+    """
 
-            # Critério de parada: maior erro entre componentes
-            erro = max(abs(x[i] - x_old[i]) for i in range(n))
+    diag = A.diagonal() if isinstance(A, CSRMatrix) else np.diagonal(np.asarray(A, dtype=float))
+    A = A if isinstance(A, CSRMatrix) else np.asarray(A, dtype=float)
 
-            if erro < tol:
-                return x, it+1
+    def J(v):
+        return v - (A @ v) / diag
 
-        # Caso não converja no limite de iterações
-        return x, max_iter
+    # Vetor inicial determinístico, sem simetria com os autovetores
+    v = np.linspace(1.0, 2.0, len(diag))
+    v /= np.linalg.norm(v)
+    rho = 0.0
+
+    for _ in range(max_iter):
+        w = J(J(v))
+        norma = np.linalg.norm(w)
+
+        if norma == 0:
+            return 0.0
+
+        novo = np.sqrt(norma)
+        v = w / norma
+
+        if abs(novo - rho) < tol * max(novo, 1.0):
+            return float(novo)
+        rho = novo
+
+    return float(rho)
+
+
+
+def optimal_sor_omega(A):
+    """
+    Fator de relaxação ótimo ω = 2 / (1 + √(1 - ρ(J)²)).
+    Se ρ(J) ≥ 1 a fórmula não se aplica e retorna ω = 1 (Gauss-Seidel).
+    """
+
+    rho = jacobi_spectral_radius(A)
+
+    if rho >= 1:
+        return 1.0
+
+    return 2.0 / (1.0 + (1.0 - rho**2) ** 0.5)
+
+
+
+def sor(A, b, x0, omega="auto", tol=1e-4, max_iter=1000, history=None, monitor=None):
+    """
+    Método SOR (Successive Over-Relaxation): Gauss-Seidel com fator de
+    relaxação ω ∈ (0, 2). Com omega="auto", ω é estimado a partir do
+    raio espectral da matriz de Jacobi (optimal_sor_omega).
+    Retorna a solução aproximada e o número de iterações.
+    """
+
+    try:
+        if omega == "auto":
+            omega = optimal_sor_omega(A)
+
+        if not 0 < omega < 2:
+            raise ValueError("O fator de relaxação deve estar em (0, 2).")
+
+        return _relaxation(A, b, x0, tol, max_iter, history, omega, monitor)
 
     except Exception as e:
-        print("Erro no método de Gauss-Seidel:", e)
+        print("Erro no método SOR:", e)
+        return None, None
+
+
+
+class IncompleteCholesky:
+    """
+    Fatoração de Cholesky incompleta IC(0): A ≈ L·Lᵀ, com L restrita ao
+    padrão de esparsidade do triângulo inferior de A (nenhum elemento
+    novo é criado). Usada como pré-condicionador do Gradiente Conjugado;
+    apply(r) resolve L·Lᵀ·z = r em O(nnz).
+    """
+
+    def __init__(self, A):
+        if not isinstance(A, CSRMatrix):
+            A = CSRMatrix.from_dense(A)
+
+        n = A.shape[0]
+        data = A.data.tolist()
+        indices = A.indices.tolist()
+        indptr = A.indptr.tolist()
+
+        linhas = []
+        diag = [0.0] * n
+
+        for i in range(n):
+            # Elementos do triângulo inferior estrito da linha i, por coluna
+            a_i = {}
+            a_ii = 0.0
+            for p in range(indptr[i], indptr[i+1]):
+                j = indices[p]
+                if j < i:
+                    a_i[j] = a_i.get(j, 0.0) + data[p]
+                elif j == i:
+                    a_ii += data[p]
+
+            L_i = {}
+            for k in sorted(a_i):
+                L_k = linhas[k]
+                s = a_i[k] - sum(v * L_k[j] for j, v in L_i.items() if j in L_k)
+                L_i[k] = s / diag[k]
+
+            d = a_ii - sum(v * v for v in L_i.values())
+            if d <= 0:
+                raise ValueError("Cholesky incompleta falhou: a matriz não é positiva definida.")
+
+            diag[i] = d ** 0.5
+            linhas.append(L_i)
+
+        self.n = n
+        self._diag = diag
+        self._rows = [(list(L_i.keys()), list(L_i.values())) for L_i in linhas]
+
+    def apply(self, r):
+        """Retorna z tal que L·Lᵀ·z = r."""
+        diag = self._diag
+        rows = self._rows
+
+        # Substituição progressiva: L·y = r
+        y = [float(v) for v in r]
+        for i in range(self.n):
+            cols, vals = rows[i]
+            y[i] = (y[i] - sum(map(mul, vals, map(y.__getitem__, cols)))) / diag[i]
+
+        # Substituição regressiva: Lᵀ·z = y (percorrendo L por linhas)
+        for i in range(self.n - 1, -1, -1):
+            y[i] /= diag[i]
+            zi = y[i]
+            cols, vals = rows[i]
+            for j, v in zip(cols, vals):
+                y[j] -= v * zi
+
+        return np.array(y)
+
+
+
+def conjugate_gradient(A, b, x0, tol=1e-4, max_iter=1000, preconditioner=None, history=None):
+    """
+    Método do Gradiente Conjugado (pré-condicionado) para matrizes
+    simétricas positivas definidas, densas ou CSRMatrix.
+
+    preconditioner: None, "jacobi" (diagonal de A) ou "ic"
+    (Cholesky incompleta IC(0)). O critério de parada é o mesmo do
+    Gauss-Seidel: maior variação entre componentes de x menor que tol.
+    Se o resíduo zerar, a solução exata é retornada na mesma iteração.
+    Retorna a solução aproximada e o número de iterações.
+
+    >>> conjugate_gradient([[1, 0, 0], [0, 1, 0], [0, 0, 1]], [1, 2, 3], [0, 0, 0])
+    ([1.0, 2.0, 3.0], 1)
+    >>> x, it = conjugate_gradient([[4, 1], [1, 3]], [1, 2], [0, 0], preconditioner="jacobi")
+    >>> [round(v, 12) for v in x], it <= 2
+    ([0.090909090909, 0.636363636364], True)
+    >>> x, it = conjugate_gradient([[2, 1], [1, 2]], [1, 1], [0, 0])
+    >>> [round(v, 12) for v in x], it
+    ([0.333333333333, 0.333333333333], 1)
+    """
+
+    try:
+        if not isinstance(A, CSRMatrix):
+            A = np.asarray(A, dtype=float)
+
+        b = np.asarray(b, dtype=float)
+        x = np.array(x0, dtype=float)
+
+        if preconditioner is None:
+            M = lambda r: r
+        elif preconditioner == "jacobi":
+            diag = A.diagonal() if isinstance(A, CSRMatrix) else np.diagonal(A).copy()
+            if np.any(diag <= 0):
+                raise ValueError("Diagonal não positiva: a matriz não é positiva definida.")
+            M = lambda r: r / diag
+        elif preconditioner == "ic":
+            M = IncompleteCholesky(A).apply
+        else:
+            raise ValueError(f"Pré-condicionador desconhecido: {preconditioner!r} (use None, 'jacobi' ou 'ic').")
+
+        r = b - A @ x
+        if not np.any(r):
+            return x.tolist(), 0
+
+        z = M(r)
+        p = z.copy()
+        rz = r @ z
+
+        for it in range(1, max_iter+1):
+            Ap = A @ p
+            pAp = p @ Ap
+
+            if pAp <= 0 and np.any(p):
+                raise ValueError("A matriz não é positiva definida.")
+
+            alpha = rz / pAp
+            x += alpha * p
+            r -= alpha * Ap
+
+            # Critério de parada: maior variação entre componentes
+            erro = abs(alpha) * np.max(np.abs(p))
+
+            z = M(r)
+            rz_novo = r @ z
+
+            # Resíduo nulo: x já é a solução exata (continuar daria p = 0)
+            exato = not np.any(r) or rz_novo == 0
+
+            if history is not None:
+                history.record(it, x, erro, force=exato or erro < tol or it == max_iter)
+
+            if exato or erro < tol:
+                return x.tolist(), it
+
+            p *= rz_novo / rz
+            p += z
+            rz = rz_novo
+
+        return x.tolist(), max_iter
+
+    except Exception as e:
+        print("Erro no método do Gradiente Conjugado:", e)
         return None, None
 
 
 
+def _diagonal_and_offdiagonal(A):
+    """Retorna |aᵢᵢ| e Σⱼ≠ᵢ |aᵢⱼ| de cada linha, para matriz densa ou CSRMatrix."""
+
+    if isinstance(A, CSRMatrix):
+        linhas = np.repeat(np.arange(A.shape[0]), np.diff(A.indptr))
+        soma = np.bincount(linhas, weights=np.abs(A.data), minlength=A.shape[0])
+        diag = np.abs(A.diagonal())
+    else:
+        A = np.abs(np.asarray(A, dtype=float))
+        soma = A.sum(axis=1)
+        diag = np.diagonal(A)
+
+    return diag, soma - diag
+
+
+
+def is_diagonally_dominant(A):
+    """
+    Verifica se a matriz é estritamente diagonalmente dominante por linhas.
+    Retorna (True, None) ou (False, número da primeira linha que falha).
+    Aceita matriz densa ou CSRMatrix.
+    """
+
+    diag, fora = _diagonal_and_offdiagonal(A)
+
+    falha = np.nonzero(diag <= fora)[0]
+    if len(falha):
+        return False, int(falha[0]) + 1
+    return True, None
+
+
+
+def is_symmetric(A, tol=1e-12):
+    """Verifica se A = Aᵀ (com tolerância relativa), densa ou CSRMatrix."""
+
+    if isinstance(A, CSRMatrix):
+        if A.shape[0] != A.shape[1]:
+            return False
+        n = A.shape[0]
+        linhas = np.repeat(np.arange(n), np.diff(A.indptr))
+        nz = A.data != 0
+        linhas, colunas, valores = linhas[nz], A.indices[nz], A.data[nz]
+
+        # Compara as entradas ordenadas por (i, j) com as ordenadas por (j, i)
+        ordem = np.argsort(linhas * n + colunas, kind="stable")
+        ordem_t = np.argsort(colunas * n + linhas, kind="stable")
+        return (np.array_equal(linhas[ordem], colunas[ordem_t])
+                and np.array_equal(colunas[ordem], linhas[ordem_t])
+                and np.allclose(valores[ordem], valores[ordem_t], rtol=tol, atol=0))
+
+    A = np.asarray(A, dtype=float)
+    return A.shape[0] == A.shape[1] and np.allclose(A, A.T, rtol=tol, atol=0)
+
+
+
+# Limites de tamanho usados na escolha automática do método
+DIRECT_MAX_N = 300
+DENSE_LU_MAX_N = 5000
+
+SOLVER_NAMES = {
+    "lu": "Eliminação de Gauss (LU)",
+    "gauss_seidel": "Gauss-Seidel",
+    "sor": "SOR (ω automático)",
+    "cg": "Gradiente Conjugado (pré-condicionador Jacobi)",
+}
+
+
+
+def choose_solver(A):
+    """
+    Escolhe, antes de iterar, o método mais barato com convergência
+    garantida para a estrutura de A. Retorna (método, motivo), onde
+    método é uma das chaves de SOLVER_NAMES.
+    """
+
+    esparsa = isinstance(A, CSRMatrix)
+    n = A.shape[0] if esparsa else len(A)
+    nnz = A.nnz if esparsa else int(np.count_nonzero(np.asarray(A, dtype=float)))
+    densidade = nnz / (n * n) if n else 0.0
+    info = f"n = {n}, densidade = {densidade:.1%}"
+
+    if not esparsa and n <= DIRECT_MAX_N:
+        return "lu", (f"Sistema pequeno e denso ({info}): a eliminação de Gauss "
+                      "resolve de forma exata com custo menor que o de iterar.")
+
+    dominante, _ = is_diagonally_dominant(A)
+    diag_abs, fora = _diagonal_and_offdiagonal(A)
+    diag = A.diagonal() if esparsa else np.diagonal(np.asarray(A, dtype=float))
+
+    # Dominância fraca com ao menos uma linha estrita: caso típico das
+    # matrizes de malhas, em que só as malhas com fonte/resistor externo
+    # são estritamente dominantes
+    fracamente = bool(np.all(diag_abs >= fora) and np.any(diag_abs > fora))
+
+    if dominante and np.all(diag > 0) and is_symmetric(A):
+        return "cg", (f"Matriz simétrica, com diagonal positiva e estritamente diagonalmente "
+                      f"dominante, logo positiva definida ({info}): o Gradiente Conjugado "
+                      "converge em O(√κ) iterações.")
+
+    if fracamente and np.all(diag > 0) and is_symmetric(A):
+        return "cg", (f"Matriz simétrica, com diagonal positiva e fracamente diagonalmente "
+                      f"dominante ({info}): é semidefinida positiva, e positiva definida se "
+                      "for irredutível; tentando o Gradiente Conjugado, com a eliminação de "
+                      "Gauss como reserva caso ele falhe.")
+
+    if dominante:
+        return "gauss_seidel", (f"Matriz diagonalmente dominante, mas não simétrica ({info}): "
+                                "Gauss-Seidel tem convergência garantida.")
+
+    if n <= DENSE_LU_MAX_N:
+        return "lu", (f"Matriz sem dominância diagonal ({info}): nenhum método iterativo "
+                      "tem convergência garantida, então a eliminação de Gauss é usada.")
+
+    return "sor", (f"Matriz grande sem dominância diagonal ({info}): a eliminação densa "
+                   "não cabe na memória; tentando SOR com ω estimado, sem garantia de convergência.")
+
+
+
+def solve_system(A, b, x0=None, tol=1e-4, max_iter=1000, history=None):
+    """
+    Front-end de resolução: escolhe o método com choose_solver e resolve.
+    Retorna (x, método, motivo, iterações); iterações é None para
+    o método direto. history (IterationHistory) é repassado ao método
+    iterativo, se houver.
+    """
+
+    metodo, motivo = choose_solver(A)
+
+    if metodo == "lu":
+        denso = A.to_dense() if isinstance(A, CSRMatrix) else A
+        return gauss_elimination(denso, b), metodo, motivo, None
+
+    if x0 is None:
+        diag = A.diagonal() if isinstance(A, CSRMatrix) else np.diagonal(np.asarray(A, dtype=float))
+        x0 = np.asarray(b, dtype=float) / diag
+
+    if metodo == "cg":
+        x, it = conjugate_gradient(A, b, x0, tol, max_iter, preconditioner="jacobi", history=history)
+    elif metodo == "gauss_seidel":
+        x, it = gauss_seidel(A, b, x0, tol, max_iter, history=history)
+    else:
+        x, it = sor(A, b, x0, "auto", tol, max_iter, history=history)
+
+    # Dominância fraca não garante positividade em matrizes redutíveis:
+    # se o método iterativo falhar e a matriz couber densa, usa LU
+    n = A.shape[0] if isinstance(A, CSRMatrix) else len(A)
+    if x is None and n <= DENSE_LU_MAX_N:
+        denso = A.to_dense() if isinstance(A, CSRMatrix) else A
+        motivo += f" {SOLVER_NAMES[metodo]} falhou; usada a eliminação de Gauss."
+        return gauss_elimination(denso, b), "lu", motivo, None
+
+    return x, metodo, motivo, it
+
+
+
 def modulo_topico2_questao3():
     """
     Módulo que resolve sistemas pelo método de Gauss-Seidel.
@@ -221,83 +1300,503 @@ def modulo_topico2_questao3():
             if len(b) != n:
                 raise ValueError("b deve conter N valores.")
 
-        # Chute inicial sugerido
-        x0 = [b[i] / A[i][i] for i in range(n)]
+        # Chute inicial sugerido
+        x0 = [b[i] / A[i][i] for i in range(n)]
+
+        sol, it = gauss_seidel(A, b, x0)
+
+        if sol:
+            print("\nSolução aproximada do sistema:")
+            for i, val in enumerate(sol):
+                print(f"x{i+1} = {val:.6f}")
+            print("Iterações:", it)
+
+    except ValueError as e:
+        print("Entrada inválida:", e)
+
+    input("\nPressione ENTER para voltar ao menu...")
+
+
+
+# ============================================================
+#  INTERPOLAÇÃO POLINOMIAL – TÓPICO 3 QUESTÃO 2
+# ============================================================
+
+def lagrange_interp(x, y, x0):
+    """
+    Calcula P(x0) usando o polinômio interpolador de Lagrange.
+    """
+
+    total = 0
+    try:
+        n = len(x)
+
+        # Para cada polinômio base L_i(x)
+        for i in range(n):
+            L = 1
+            for j in range(n):
+                if i != j:
+                    # Fórmula de L_i(x0)
+                    L *= (x0 - x[j]) / (x[i] - x[j])
+
+            total += L * y[i]
+
+    except:
+        return None
+
+    return total
+
+
+
+class BarycentricInterpolator:
+    """
+    Polinômio interpolador de Lagrange na forma baricêntrica.
+
+    Os pesos wⱼ = 1 / Πₖ≠ⱼ (xⱼ - xₖ) são calculados uma única vez em
+    O(n²), normalizados pelo maior (só a razão importa); depois cada
+    avaliação custa O(n):
+
+        P(x) = Σ wⱼ·yⱼ/(x - xⱼ)  /  Σ wⱼ/(x - xⱼ)
+
+    O objeto aceita um escalar ou um array de pontos (avaliação vetorizada).
+    """
+
+    # Pontos avaliados por bloco, para limitar a memória da matriz x - xⱼ
+    CHUNK = 65536
+
+    def __init__(self, x, y):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+
+        if self.x.ndim != 1 or self.x.shape != self.y.shape:
+            raise ValueError("x e y devem ser vetores de mesmo tamanho.")
+        if len(np.unique(self.x)) != len(self.x):
+            raise ValueError("Os valores de x devem ser distintos.")
+
+        # O produto direto estoura (ou zera) com algumas centenas de nós:
+        # soma-se log|xⱼ - xₖ| e os pesos são divididos pelo maior deles,
+        # o que não altera a razão baricêntrica
+        dif = self.x[:, None] - self.x[None, :]
+        np.fill_diagonal(dif, 1.0)
+        log_prod = np.log(np.abs(dif)).sum(axis=1)
+        sinal = np.prod(np.sign(dif), axis=1)
+        self.weights = sinal * np.exp(log_prod.min() - log_prod)
+
+    def __call__(self, x0):
+        pontos = np.asarray(x0, dtype=float)
+        planos = pontos.ravel()
+        resultado = np.empty_like(planos)
+
+        for inicio in range(0, len(planos), self.CHUNK):
+            bloco = planos[inicio:inicio + self.CHUNK]
+            resultado[inicio:inicio + self.CHUNK] = self._evaluate(bloco)
+
+        if pontos.ndim == 0:
+            return float(resultado[0])
+        return resultado.reshape(pontos.shape)
+
+    def _evaluate(self, pontos):
+        dif = pontos[:, None] - self.x[None, :]
+
+        # Pontos que coincidem com um nó recebem diretamente yⱼ
+        exato = dif == 0
+        dif[exato] = 1.0
+
+        termos = self.weights / dif
+        valores = (termos @ self.y) / termos.sum(axis=1)
+
+        linhas, nos = np.nonzero(exato)
+        valores[linhas] = self.y[nos]
+        return valores
+
+
+
+class NewtonPolynomial:
+    """
+    Polinômio interpolador de Newton construído uma única vez.
+
+    O construtor monta a tabela de diferenças divididas (O(n²)) e guarda
+    os coeficientes f[x₀], f[x₀,x₁], ..., f[x₀,...,xₙ] em coef. A
+    avaliação usa o esquema de Horner, em O(n) por ponto, e aceita um
+    escalar ou um array de pontos.
+
+    Novos pontos podem ser acrescentados com add_point em O(n): basta
+    estender a última diagonal da tabela, e os coeficientes anteriores
+    não mudam.
+    """
+
+    def __init__(self, x=(), y=()):
+        x = np.asarray(x, dtype=float)
+        dd = np.array(y, dtype=float)
+        n = len(x)
+
+        if x.ndim != 1 or dd.shape != x.shape:
+            raise ValueError("x e y devem ser vetores de mesmo tamanho.")
+        if len(np.unique(x)) != n:
+            raise ValueError("Os valores de x devem ser distintos.")
+
+        # diag[k] = f[x_{n-1-k}, ..., x_{n-1}]: última diagonal da tabela
+        diag = np.empty(n)
+        if n:
+            diag[0] = dd[-1]
+
+        # Tabela de diferenças divididas, uma coluna por vez
+        for j in range(1, n):
+            dd[j:] = (dd[j:] - dd[j-1:-1]) / (x[j:] - x[:-j])
+            diag[j] = dd[-1]
+
+        # Buffers com folga, para acrescentar pontos sem realocar sempre
+        self._n = n
+        self._x = np.resize(x, max(2 * n, 8))
+        self._coef = np.resize(dd, max(2 * n, 8))
+        self._diag = np.resize(diag, max(2 * n, 8))
+
+    @property
+    def x(self):
+        """Abscissas usadas na interpolação."""
+        return self._x[:self._n]
+
+    @property
+    def coef(self):
+        """Coeficientes de Newton (topo da tabela de diferenças divididas)."""
+        return self._coef[:self._n]
+
+    @property
+    def degree(self):
+        """Grau do polinômio (número de pontos - 1)."""
+        return self._n - 1
+
+    def add_point(self, xn, yn):
+        """
+        Acrescenta o ponto (xn, yn) e atualiza o polinômio no próprio
+        objeto, calculando apenas a nova diagonal da tabela em O(n).
+        """
+        xn = float(xn)
+        n = self._n
+
+        if np.any(self.x == xn):
+            raise ValueError("Os valores de x devem ser distintos.")
+
+        if n == len(self._x):
+            capacidade = 2 * n
+            self._x = np.resize(self._x, capacidade)
+            self._coef = np.resize(self._coef, capacidade)
+            self._diag = np.resize(self._diag, capacidade)
+
+        x = self._x
+        diag = self._diag
+
+        # Nova diagonal: f[xn] , f[x_{n-1}, xn], ..., f[x_0, ..., xn]
+        anterior = float(yn)
+        for k in range(1, n + 1):
+            atual = (anterior - diag[k-1]) / (xn - x[n-k])
+            diag[k-1] = anterior
+            anterior = atual
+        diag[n] = anterior
+
+        x[n] = xn
+        self._coef[n] = anterior
+        self._n = n + 1
+
+    def __call__(self, x0):
+        if self._n == 0:
+            raise ValueError("O polinômio não tem pontos.")
+
+        pontos = np.asarray(x0, dtype=float)
+        coef = self.coef
+        x = self.x
+
+        # Horner: P(x) = c₀ + (x - x₀)(c₁ + (x - x₁)(c₂ + ...))
+        result = np.full(pontos.shape, coef[-1])
+        for k in range(self._n - 2, -1, -1):
+            result = result * (pontos - x[k]) + coef[k]
+
+        if pontos.ndim == 0:
+            return float(result)
+        return result
+
+
+
+def newton_interp(x, y, x0):
+    """
+    Calcula o valor interpolado via método de Newton
+    usando a tabela de diferenças divididas.
+    Também retorna a tabela para fins didáticos.
+
+    Para avaliar vários pontos com os mesmos dados, construa um
+    NewtonPolynomial uma única vez e reutilize-o.
+    """
+
+    try:
+        p = NewtonPolynomial(x, y)
+        return p(x0), p.coef.tolist()
+
+    except:
+        return None, None
+
+
+
+def chebyshev_nodes(a, b, n):
+    """
+    n nós de Chebyshev (primeira espécie) no intervalo [a, b], em ordem
+    crescente. Podem ser usados diretamente em lagrange_interp,
+    newton_interp ou BarycentricInterpolator no lugar de nós igualmente
+    espaçados, evitando o fenômeno de Runge.
+    """
+
+    k = np.arange(n)
+    t = np.cos(np.pi * (k + 0.5) / n)[::-1]
+    return (a + b) / 2 + (b - a) / 2 * t
+
+
+
+class ChebyshevInterpolant:
+    """
+    Aproximação de uma função f em [a, b] pela série de Chebyshev
+    p(x) = Σ cⱼ·Tⱼ(u), u = (2x - a - b) / (b - a), interpolando f
+    nos n nós de Chebyshev.
+
+    Os coeficientes saem de uma transformada discreta de cossenos
+    (DCT-II) calculada via FFT em O(n log n); a avaliação usa a
+    recorrência de Clenshaw, em O(n) por ponto e vetorizada.
+    Com esses nós, o erro fica próximo do da melhor aproximação
+    polinomial (minimax) do mesmo grau.
+    """
+
+    def __init__(self, f, a, b, n):
+        if n < 1:
+            raise ValueError("São necessários pelo menos 1 nó.")
+        if not a < b:
+            raise ValueError("O intervalo deve satisfazer a < b.")
+
+        self.a = float(a)
+        self.b = float(b)
+
+        # Valores nos nós tₖ = cos(π(k + ½)/n), na ordem de k
+        k = np.arange(n)
+        nos = (a + b) / 2 + (b - a) / 2 * np.cos(np.pi * (k + 0.5) / n)
 
-        sol, it = gauss_seidel(A, b, x0)
+        # Funções vetorizadas são avaliadas de uma vez; as demais, ponto a ponto
+        try:
+            valores = np.asarray(f(nos), dtype=float)
+        except (TypeError, ValueError):
+            valores = None
+        if valores is None or valores.shape != (n,):
+            valores = np.array([float(f(v)) for v in nos])
 
-        if sol:
-            print("\nSolução aproximada do sistema:")
-            for i, val in enumerate(sol):
-                print(f"x{i+1} = {val:.6f}")
-            print("Iterações:", it)
+        # DCT-II via FFT da extensão par de tamanho 2n
+        V = np.fft.fft(np.concatenate((valores, valores[::-1])))[:n]
+        dct = np.real(V * np.exp(-1j * np.pi * k / (2 * n))) / 2
 
-    except ValueError as e:
-        print("Entrada inválida:", e)
+        self.coef = 2 * dct / n
+        self.coef[0] /= 2
 
-    input("\nPressione ENTER para voltar ao menu...")
+    @property
+    def degree(self):
+        """Grau do polinômio aproximador."""
+        return len(self.coef) - 1
 
+    def __call__(self, x0):
+        pontos = np.asarray(x0, dtype=float)
+        u = (2 * pontos - (self.a + self.b)) / (self.b - self.a)
 
+        # Recorrência de Clenshaw: bₖ = cₖ + 2u·bₖ₊₁ - bₖ₊₂
+        b1 = np.zeros_like(u)
+        b2 = np.zeros_like(u)
+        for c in self.coef[:0:-1]:
+            b1, b2 = c + 2 * u * b1 - b2, b1
+        result = self.coef[0] + u * b1 - b2
 
-# ============================================================
-#  INTERPOLAÇÃO POLINOMIAL – TÓPICO 3 QUESTÃO 2
-# ============================================================
+        if pontos.ndim == 0:
+            return float(result)
+        return result
 
-def lagrange_interp(x, y, x0):
+
+
+def chebyshev_interp(f, a, b, n, x0):
     """
-    Calcula P(x0) usando o polinômio interpolador de Lagrange.
+    Calcula P(x0), onde P interpola f nos n nós de Chebyshev de [a, b].
+    Para vários pontos, construa um ChebyshevInterpolant e reutilize-o.
     """
 
-    total = 0
     try:
-        n = len(x)
+        return ChebyshevInterpolant(f, a, b, n)(x0)
+    except:
+        return None
 
-        # Para cada polinômio base L_i(x)
-        for i in range(n):
-            L = 1
-            for j in range(n):
-                if i != j:
-                    # Fórmula de L_i(x0)
-                    L *= (x0 - x[j]) / (x[i] - x[j])
 
-            total += L * y[i]
 
-    except:
-        return None
+def thomas(a, b, c, d):
+    """
+    Algoritmo de Thomas: resolve um sistema tridiagonal em O(n).
+    a = subdiagonal (a[0] ignorado), b = diagonal,
+    c = superdiagonal (c[-1] ignorado), d = termo independente.
+    """
 
-    return total
+    n = len(b)
+    a = [float(v) for v in a]
+    c = [float(v) for v in c]
+    b = [float(v) for v in b]
+    d = [float(v) for v in d]
 
+    # Eliminação progressiva
+    for i in range(1, n):
+        m = a[i] / b[i-1]
+        b[i] -= m * c[i-1]
+        d[i] -= m * d[i-1]
 
+    # Substituição regressiva
+    x = [0.0] * n
+    x[-1] = d[-1] / b[-1]
+    for i in range(n-2, -1, -1):
+        x[i] = (d[i] - c[i] * x[i+1]) / b[i]
 
-def newton_interp(x, y, x0):
+    return np.array(x)
+
+
+
+class CubicSpline:
     """
-    Calcula o valor interpolado via método de Newton
-    usando a tabela de diferenças divididas.
-    Também retorna a tabela para fins didáticos.
+    Spline cúbica interpoladora, adequada para tabelas grandes.
+
+    Em vez de um único polinômio de grau alto (lento e sujeito ao
+    fenômeno de Runge), usa um polinômio cúbico por intervalo com
+    primeira e segunda derivadas contínuas. As segundas derivadas Mᵢ
+    nos nós saem de um sistema tridiagonal resolvido pelo algoritmo de
+    Thomas em O(n); a avaliação localiza o intervalo de cada ponto por
+    busca binária (np.searchsorted) e é vetorizada.
+
+    bc="natural": S''(x₀) = S''(xₙ) = 0.
+    bc="clamped": S'(x₀) = derivatives[0] e S'(xₙ) = derivatives[1].
     """
 
-    try:
+    def __init__(self, x, y, bc="natural", derivatives=(0.0, 0.0)):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        if x.ndim != 1 or x.shape != y.shape:
+            raise ValueError("x e y devem ser vetores de mesmo tamanho.")
+        if len(x) < 2:
+            raise ValueError("A spline requer pelo menos 2 pontos.")
+        if bc not in ("natural", "clamped"):
+            raise ValueError(f"Condição de contorno desconhecida: {bc!r} (use 'natural' ou 'clamped').")
+
+        ordem = np.argsort(x, kind="stable")
+        x, y = x[ordem], y[ordem]
+        h = np.diff(x)
+
+        if np.any(h == 0):
+            raise ValueError("Os valores de x devem ser distintos.")
+
         n = len(x)
+        inclinacao = np.diff(y) / h
 
-        # Tabela de diferenças divididas
-        dd = [y[i] for i in range(n)]
+        # Sistema tridiagonal para as segundas derivadas M₀..Mₙ₋₁
+        sub = np.zeros(n)
+        diag = np.ones(n)
+        sup = np.zeros(n)
+        rhs = np.zeros(n)
 
-        for j in range(1, n):
-            for i in range(n-1, j-1, -1):
-                dd[i] = (dd[i] - dd[i-1]) / (x[i] - x[i-j])
+        sub[1:-1] = h[:-1]
+        diag[1:-1] = 2 * (h[:-1] + h[1:])
+        sup[1:-1] = h[1:]
+        rhs[1:-1] = 6 * np.diff(inclinacao)
 
-        # Construção de P(x0)
-        result = dd[0]
-        produto = 1.0
+        if bc == "clamped":
+            d0, dn = derivatives
+            diag[0], sup[0] = 2 * h[0], h[0]
+            rhs[0] = 6 * (inclinacao[0] - d0)
+            sub[-1], diag[-1] = h[-1], 2 * h[-1]
+            rhs[-1] = 6 * (dn - inclinacao[-1])
 
-        for i in range(1, n):
-            produto *= (x0 - x[i-1])
-            result += dd[i] * produto
+        self.bc = bc
+        self.x = x
+        self.y = y
+        self.M = thomas(sub, diag, sup, rhs)
 
-        return result, dd
+        # Coeficientes de cada intervalo: y + b·dx + c·dx² + d·dx³
+        self._h = h
+        self._b = inclinacao - h * (2 * self.M[:-1] + self.M[1:]) / 6
+        self._c = self.M[:-1] / 2
+        self._d = np.diff(self.M) / (6 * h)
 
-    except:
-        return None, None
+    def __call__(self, x0):
+        pontos = np.asarray(x0, dtype=float)
+
+        # Intervalo de cada ponto por busca binária (extrapola nas pontas)
+        i = np.clip(np.searchsorted(self.x, pontos, side="right") - 1, 0, len(self._h) - 1)
+        dx = pontos - self.x[i]
+        result = self.y[i] + dx * (self._b[i] + dx * (self._c[i] + dx * self._d[i]))
+
+        if pontos.ndim == 0:
+            return float(result)
+        return result
+
+
+
+class NodeIndex:
+    """
+    Índice ordenado das abscissas de uma tabela, para escolher os nós
+    de uma interpolação local sem reordenar todos os pontos a cada consulta.
+
+    A ordenação é feita uma única vez (O(N log N)); depois nearest()
+    encontra os k nós mais próximos de x0 por busca binária em
+    O(log N + k). Os índices retornados se referem à tabela original.
+    """
+
+    def __init__(self, x):
+        self._order = sorted(range(len(x)), key=lambda i: x[i])
+        self._xs = [float(x[i]) for i in self._order]
+
+    def __len__(self):
+        return len(self._xs)
+
+    def nearest(self, x0, k, sort_by_x=False):
+        """
+        Índices dos k pontos mais próximos de x0, do mais próximo ao mais
+        distante (ou em ordem crescente de x, se sort_by_x=True).
+        """
+        xs = self._xs
+        k = min(k, len(xs))
+
+        # Os k mais próximos formam uma janela contígua em torno de x0
+        hi = bisect_left(xs, x0)
+        lo = hi - 1
+        escolhidos = []
+
+        while len(escolhidos) < k:
+            if hi >= len(xs) or (lo >= 0 and x0 - xs[lo] <= xs[hi] - x0):
+                escolhidos.append(lo)
+                lo -= 1
+            else:
+                escolhidos.append(hi)
+                hi += 1
+
+        if sort_by_x:
+            return self._order[lo+1:hi]
+        return [self._order[p] for p in escolhidos]
+
+    def nearest_many(self, x0, k):
+        """
+        Versão em lote: para um array de m consultas, retorna um array
+        (m, k) com os índices dos k nós mais próximos de cada uma,
+        do mais próximo ao mais distante.
+        """
+        xs = np.asarray(self._xs)
+        ordem = np.asarray(self._order)
+        consultas = np.asarray(x0, dtype=float).ravel()
+        N = len(xs)
+        k = min(k, N)
+
+        # Janela candidata de 2k posições ordenadas em torno de cada consulta
+        largura = min(2 * k, N)
+        pos = np.searchsorted(xs, consultas)
+        inicio = np.clip(pos - k, 0, N - largura)
+        janela = inicio[:, None] + np.arange(largura)
+
+        dist = np.abs(xs[janela] - consultas[:, None])
+        melhores = np.argsort(dist, axis=1, kind="stable")[:, :k]
+        return ordem[np.take_along_axis(janela, melhores, axis=1)]
 
 
 
@@ -328,12 +1827,13 @@ def modulo_topico3_questao2():
 
         print("\nResultados da Interpolação de Lagrange:")
 
-        # Ordena os pares pelo mais próximo de x0
-        pares = list(zip(x, y))
-        pares.sort(key=lambda p: abs(p[0] - x0))
+        # Índice ordenado para buscar os pontos mais próximos de x0
+        indice = NodeIndex(x)
 
         for grau in range(2, min(4, len(x)-1)+1):
-            xx, yy = zip(*pares[:grau+1])
+            nos = indice.nearest(x0, grau+1)
+            xx = [x[i] for i in nos]
+            yy = [y[i] for i in nos]
             L = lagrange_interp(xx, yy, x0)
             print(f"Ordem {grau}: {L:.6f}")
 
@@ -351,10 +1851,18 @@ def modulo_topico3_questao2():
 def trapezio_repetido(x, y):
     """
     Integração numérica pelo método dos Trapézios (composto).
+    Listas usam a soma em Python; ndarrays (e demais sequências)
+    usam o caminho vetorizado, adequado a milhões de amostras.
     """
 
     try:
         h = x[1] - x[0]
+
+        if not isinstance(y, (list, tuple)):
+            # Soma de todas as ordenadas menos metade das extremidades
+            y = np.asarray(y, dtype=float)
+            return float(h * (y.sum() - (y[0] + y[-1]) / 2))
+
         return h * (y[0] + y[-1] + 2*sum(y[1:-1])) / 2
     except:
         return None
@@ -364,6 +1872,8 @@ def trapezio_repetido(x, y):
 def simpson_repetido(x, y):
     """
     Integração numérica pelo método de Simpson 1/3 (composto).
+    Listas usam a soma em Python; ndarrays (e demais sequências)
+    usam fatias com passo 2, sem laços em Python.
     """
 
     try:
@@ -373,6 +1883,12 @@ def simpson_repetido(x, y):
         if (len(x)-1) % 2 != 0:
             raise ValueError("Simpson requer número PAR de intervalos.")
 
+        if not isinstance(y, (list, tuple)):
+            # Ordenadas ímpares (peso 4) e pares internas (peso 2)
+            y = np.asarray(y, dtype=float)
+            soma = y[0] + y[-1] + 4 * y[1:-1:2].sum() + 2 * y[2:-1:2].sum()
+            return float(h * soma / 3)
+
         soma = y[0] + y[-1]
         soma += 4 * sum(y[i] for i in range(1, len(x)-1, 2))
         soma += 2 * sum(y[i] for i in range(2, len(x)-2, 2))
@@ -384,6 +1900,314 @@ def simpson_repetido(x, y):
 
 
 
+def trapezio_nao_uniforme(x, y):
+    """
+    Regra dos Trapézios para espaçamento arbitrário:
+    Σ (xᵢ₊₁ - xᵢ)(yᵢ + yᵢ₊₁)/2, vetorizada sobre diff(x).
+    """
+
+    try:
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        if len(x) != len(y) or len(x) < 2:
+            raise ValueError("x e y devem ter o mesmo tamanho e pelo menos 2 pontos.")
+
+        return float(np.diff(x) @ (y[1:] + y[:-1]) / 2)
+    except:
+        return None
+
+
+
+def simpson_nao_uniforme(x, y):
+    """
+    Regra de Simpson 1/3 para espaçamento arbitrário.
+
+    Cada par de intervalos (h₀, h₁) é integrado pela parábola que passa
+    pelos três pontos. Com número ímpar de intervalos, o último é
+    integrado pela mesma parábola dos três últimos pontos, preservando
+    a ordem do método. Com espaçamento uniforme, coincide com
+    simpson_repetido.
+    """
+
+    try:
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        if len(x) != len(y) or len(x) < 3:
+            raise ValueError("Simpson requer o mesmo tamanho em x e y e pelo menos 3 pontos.")
+
+        h = np.diff(x)
+        if np.any(h == 0):
+            raise ValueError("Os valores de x devem ser distintos.")
+
+        # Pares de intervalos completos
+        m = len(h) // 2
+        h0 = h[0:2*m:2]
+        h1 = h[1:2*m:2]
+        y0 = y[0:2*m:2]
+        y1 = y[1:2*m:2]
+        y2 = y[2:2*m+1:2]
+
+        soma = (h0 + h1) / 6 * ((2 - h1/h0) * y0
+                                + (h0 + h1)**2 / (h0 * h1) * y1
+                                + (2 - h0/h1) * y2)
+        total = soma.sum()
+
+        # Intervalo final restante (número ímpar de intervalos)
+        if len(h) % 2 == 1:
+            a, b = h[-2], h[-1]
+            alfa = (2*b**2 + 3*a*b) / (6 * (a + b))
+            beta = (b**2 + 3*a*b) / (6 * a)
+            eta = b**3 / (6 * a * (a + b))
+            total += alfa * y[-1] + beta * y[-2] - eta * y[-3]
+
+        return float(total)
+    except:
+        return None
+
+
+
+def _richardson(tabela, T):
+    """
+    Acrescenta à tabela de Romberg a linha obtida do trapézio T com
+    o passo atual, extrapolando com os fatores 4ʲ. Retorna a linha.
+    """
+
+    linha = [T]
+    anterior = tabela[-1] if tabela else []
+    for j, R in enumerate(anterior, start=1):
+        linha.append(linha[j-1] + (linha[j-1] - R) / (4**j - 1))
+    tabela.append(linha)
+    return linha
+
+
+
+def romberg(f, a, b, tol=1e-10, max_niveis=20):
+    """
+    Integral de f em [a, b] pelo método de Romberg.
+
+    Cada nível divide h ao meio: as ordenadas já calculadas são
+    reaproveitadas e só os novos pontos médios são avaliados. O trapézio
+    de cada nível (trapezio_repetido) é extrapolado por Richardson ao
+    longo da tabela. Para quando dois termos diagonais consecutivos
+    diferem menos que tol.
+    Retorna (valor, erro estimado, número de avaliações de f).
+    """
+
+    try:
+        avaliar, contador = _avaliador(f)
+
+        y = avaliar(np.array([a, b], dtype=float))
+        tabela = []
+        _richardson(tabela, trapezio_repetido((a, b), y))
+        erro = float("inf")
+
+        for nivel in range(1, max_niveis + 1):
+            n = len(y) - 1
+            x = np.linspace(a, b, 2*n + 1)
+
+            # Intercala as ordenadas antigas com as dos novos pontos médios
+            novo = np.empty(2*n + 1)
+            novo[::2] = y
+            novo[1::2] = avaliar(x[1::2])
+            y = novo
+
+            linha = _richardson(tabela, trapezio_repetido(x, y))
+            erro = abs(linha[-1] - tabela[-2][-1])
+            if erro <= tol and nivel >= 2:
+                break
+
+        return tabela[-1][-1], erro, contador[0]
+
+    except Exception as e:
+        print("Erro na integração de Romberg:", e)
+        return None, None, None
+
+
+
+def romberg_tabela(x, y):
+    """
+    Romberg sobre uma tabela uniforme (x, y) já medida.
+
+    Enquanto o número de intervalos for par, a malha com passo 2h é
+    obtida tomando um ponto sim, outro não. Os trapézios, do passo mais
+    grosso ao mais fino, formam a primeira coluna da tabela de Richardson.
+    Retorna (valor, erro estimado, tabela); com um só nível não há
+    extrapolação e o erro é None.
+    """
+
+    try:
+        if len(x) != len(y) or len(x) < 2:
+            raise ValueError("x e y devem ter o mesmo tamanho e pelo menos 2 pontos.")
+
+        # Dobra o passo enquanto sobrar mais de um intervalo e a divisão for exata
+        n = len(x) - 1
+        passos = 1
+        while n // passos > 1 and n % (2 * passos) == 0:
+            passos *= 2
+
+        tabela = []
+        while passos >= 1:
+            _richardson(tabela, trapezio_repetido(x[::passos], y[::passos]))
+            passos //= 2
+
+        erro = None
+        if len(tabela) > 1:
+            erro = abs(tabela[-1][-1] - tabela[-2][-1])
+        return tabela[-1][-1], erro, tabela
+
+    except Exception as e:
+        print("Erro na tabela de Romberg:", e)
+        return None, None, None
+
+
+
+# Nós e pesos de Gauss-Kronrod 7-15 em [-1, 1] (metade positiva, o último é o centro)
+_GK15_NOS = (
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.000000000000000000000000000000000,
+)
+_GK15_PESOS_K = (
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714,
+)
+# Pesos de Gauss de 7 pontos, associados aos nós de índice ímpar acima
+_GK15_PESOS_G = (
+    0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975, 0.417959183673469387755102040816327,
+)
+
+
+
+@lru_cache(maxsize=None)
+def _gk15_regra():
+    """
+    Nós e pesos (Kronrod e Gauss) nos 15 pontos, montados no primeiro
+    uso para não importar numpy junto com o módulo.
+    """
+
+    nos = np.array(_GK15_NOS)
+    pesos_k = np.array(_GK15_PESOS_K)
+    pesos_g = np.array(_GK15_PESOS_G)
+
+    t = np.concatenate((-nos[:-1], nos[::-1]))
+    wk = np.concatenate((pesos_k[:-1], pesos_k[::-1]))
+    wg = np.zeros(15)
+    wg[1:7:2] = pesos_g[:3]
+    wg[7] = pesos_g[3]
+    wg[9:15:2] = pesos_g[2::-1]
+    return t, wk, wg
+
+
+
+def _avaliador(f):
+    """
+    Envolve f contando as avaliações. Se f aceitar arrays, avalia
+    todos os nós de uma vez; caso contrário, ponto a ponto.
+    """
+
+    contador = [0]
+
+    def avaliar(pontos):
+        contador[0] += len(pontos)
+        try:
+            valores = np.asarray(f(pontos), dtype=float)
+            if valores.shape == pontos.shape:
+                return valores
+        except (TypeError, ValueError):
+            pass
+        return np.array([float(f(p)) for p in pontos])
+
+    return avaliar, contador
+
+
+
+def integracao_adaptativa(f, a, b, tol=1e-8, metodo="gk15", max_eval=100000):
+    """
+    Integral de uma função f em [a, b] por quadratura adaptativa global.
+
+    Os subintervalos ficam em um heap ordenado pelo erro estimado; a cada
+    passo o pior deles é dividido ao meio, até que a soma dos erros fique
+    abaixo de tol ou se atinja max_eval avaliações. Assim as avaliações
+    se concentram onde o integrando é irregular.
+
+    metodo="gk15": Gauss-Kronrod 7-15 (erro estimado por |K15 - G7|).
+    metodo="simpson": Simpson adaptativo (erro |S₂ - S₁|/15, com
+    extrapolação de Richardson).
+    Retorna (valor, erro estimado, número de avaliações de f).
+    """
+
+    try:
+        if metodo not in ("gk15", "simpson"):
+            raise ValueError(f"Método desconhecido: {metodo!r} (use 'gk15' ou 'simpson').")
+
+        avaliar, contador = _avaliador(f)
+
+        if metodo == "gk15":
+            t, wk, wg = _gk15_regra()
+
+            def segmento(a, b, _):
+                centro, meia = (a + b) / 2, (b - a) / 2
+                valores = avaliar(centro + meia * t)
+                kronrod = meia * (wk @ valores)
+                gauss = meia * (wg @ valores)
+                return kronrod, abs(kronrod - gauss), None
+        else:
+            def segmento(a, b, extremos):
+                # extremos = (f(a), f(m), f(b)); só os quartos são novos
+                fa, fm, fb = extremos
+                m = (a + b) / 2
+                fl, fr = avaliar(np.array([(a + m) / 2, (m + b) / 2]))
+                h = b - a
+                s1 = h * (fa + 4*fm + fb) / 6
+                s2 = h * (fa + 4*fl + 2*fm + 4*fr + fb) / 12
+                return s2 + (s2 - s1) / 15, abs(s2 - s1) / 15, (fa, fl, fm, fr, fb)
+
+        def dividir(a, b, dados):
+            m = (a + b) / 2
+            if metodo == "gk15":
+                return (a, m, None), (m, b, None)
+            fa, fl, fm, fr, fb = dados
+            return (a, m, (fa, fl, fm)), (m, b, (fm, fr, fb))
+
+        inicial = None
+        if metodo == "simpson":
+            inicial = tuple(avaliar(np.array([a, (a + b) / 2, b])))
+
+        valor, erro, dados = segmento(a, b, inicial)
+        heap = [(-erro, 0, a, b, valor, erro, dados)]
+        contador_seg = 1
+        total_valor, total_erro = valor, erro
+
+        while total_erro > tol and contador[0] < max_eval:
+            _, _, sa, sb, valor, erro, dados = heappop(heap)
+            total_valor -= valor
+            total_erro -= erro
+
+            for na, nb, nd in dividir(sa, sb, dados):
+                valor, erro, dados_novos = segmento(na, nb, nd)
+                heappush(heap, (-erro, contador_seg, na, nb, valor, erro, dados_novos))
+                contador_seg += 1
+                total_valor += valor
+                total_erro += erro
+
+        # Soma final exata, sem o acúmulo de arredondamentos das atualizações
+        total_valor = math.fsum(item[4] for item in heap)
+        total_erro = math.fsum(item[5] for item in heap)
+
+        return total_valor, total_erro, contador[0]
+
+    except Exception as e:
+        print("Erro na integração adaptativa:", e)
+        return None, None, None
+
+
+
 def modulo_topico4_questao3():
     """
     Módulo de integração numérica — área transversal do navio.
@@ -455,6 +2279,524 @@ def menu():
 
 
 
+# ============================================================
+#  PROCESSAMENTO EM LOTE (LINHA DE COMANDO)
+# ============================================================
+
+def _resolver_sistema(p):
+    """
+    Problema {"tipo": "sistema", "A", "b"}. metodo: "auto" (solve_system),
+    "gauss", "gauss_seidel", "sor" ou "cg"; opcionais x0, tol, max_iter.
+    Um método iterativo que esgota max_iter sem atingir tol é tratado
+    como erro, com o erro final na mensagem.
+    """
+
+    A, b = p["A"], p["b"]
+    metodo = p.get("metodo", "auto")
+    tol, max_iter = p.get("tol", 1e-4), p.get("max_iter", 1000)
+    x0 = p.get("x0")
+    iteracoes = None
+
+    # Só a última iteração é guardada: basta para saber o erro final
+    historico = IterationHistory(len(b), every=max_iter, size=1)
+
+    if metodo == "auto":
+        x, metodo, _, iteracoes = solve_system(A, b, x0, tol, max_iter, history=historico)
+    elif metodo == "gauss":
+        x = gauss_elimination(A, b)
+    elif metodo in ("gauss_seidel", "sor", "cg"):
+        if x0 is None:
+            x0 = (np.asarray(b, dtype=float) / np.diagonal(np.asarray(A, dtype=float))).tolist()
+        if metodo == "gauss_seidel":
+            x, iteracoes = gauss_seidel(A, b, x0, tol, max_iter, history=historico)
+        elif metodo == "sor":
+            x, iteracoes = sor(A, b, x0, "auto", tol, max_iter, history=historico)
+        else:
+            x, iteracoes = conjugate_gradient(A, b, x0, tol, max_iter, preconditioner="jacobi",
+                                              history=historico)
+    else:
+        raise ValueError(f"Método de sistema desconhecido: {metodo!r}")
+
+    if x is None:
+        raise ValueError("Sistema singular ou método não convergiu.")
+
+    erro_final = None
+    if iteracoes is not None and len(historico):
+        erro_final = float(historico.entries()[-1][2])
+        if iteracoes >= max_iter and erro_final >= tol:
+            raise ValueError(f"Não convergiu em {max_iter} iterações "
+                             f"(erro final {erro_final:.3e} ≥ tol = {tol:g}).")
+
+    residuo = np.asarray(A, dtype=float) @ np.asarray(x, dtype=float) - np.asarray(b, dtype=float)
+    return {"metodo": metodo, "x": x, "iteracoes": iteracoes, "erro_final": erro_final,
+            "residuo": float(np.max(np.abs(residuo)))}
+
+
+
+def _resolver_interpolacao(p):
+    """
+    Problema {"tipo": "interpolacao", "x", "y", "x0"}; x0 pode ser um
+    número ou uma lista. metodo: "newton" (padrão), "lagrange" ou
+    "spline". Com "grau", cada ponto usa os grau+1 nós mais próximos.
+
+    Cada polinômio é montado uma vez por conjunto de nós e avaliado em
+    todos os pontos que o usam de uma só vez.
+    """
+
+    x, y, pontos = np.asarray(p["x"], dtype=float), np.asarray(p["y"], dtype=float), p["x0"]
+    metodo = p.get("metodo", "newton")
+    grau = p.get("grau")
+    escalar = not isinstance(pontos, (list, tuple))
+    pontos = np.atleast_1d(np.asarray(pontos, dtype=float))
+
+    if metodo == "spline":
+        construir = CubicSpline
+    elif metodo == "newton":
+        construir = NewtonPolynomial
+    elif metodo == "lagrange":
+        construir = BarycentricInterpolator
+    else:
+        raise ValueError(f"Método de interpolação desconhecido: {metodo!r}")
+
+    if grau is None or metodo == "spline":
+        valores = construir(x, y)(pontos)
+    else:
+        # Nós de cada ponto em ordem crescente de índice: pontos vizinhos
+        # costumam compartilhar o mesmo conjunto e, portanto, o polinômio
+        nos = np.sort(NodeIndex(x).nearest_many(pontos, grau + 1), axis=1)
+        conjuntos, grupo = np.unique(nos, axis=0, return_inverse=True)
+        grupo = grupo.ravel()
+        valores = np.empty(len(pontos))
+        for g, indices in enumerate(conjuntos):
+            selecionados = grupo == g
+            valores[selecionados] = construir(x[indices], y[indices])(pontos[selecionados])
+
+    if not np.all(np.isfinite(valores)):
+        raise ValueError("Falha na interpolação (valor não finito).")
+
+    valores = [float(v) for v in valores]
+    return {"metodo": metodo, "valor": valores[0]} if escalar else {"metodo": metodo, "valores": valores}
+
+
+
+def _resolver_integracao(p):
+    """
+    Problema {"tipo": "integracao", "x", "y"}. metodo: "simpson"
+    (padrão), "trapezio" ou "romberg". Malhas não uniformes usam as
+    regras com hᵢ variável; Simpson com número ímpar de intervalos usa
+    a correção do último intervalo de simpson_nao_uniforme.
+    """
+
+    x, y = p["x"], p["y"]
+    metodo = p.get("metodo", "simpson")
+    erro = None
+
+    h = x[1] - x[0]
+    uniforme = all(abs(x[i+1] - x[i] - h) <= 1e-9 * abs(h) for i in range(len(x) - 1))
+
+    if metodo == "trapezio":
+        area = trapezio_repetido(x, y) if uniforme else trapezio_nao_uniforme(x, y)
+    elif metodo == "simpson":
+        par = (len(x) - 1) % 2 == 0
+        area = simpson_repetido(x, y) if uniforme and par else simpson_nao_uniforme(x, y)
+    elif metodo == "romberg":
+        if not uniforme:
+            raise ValueError("Romberg requer espaçamento uniforme.")
+        area, erro, _ = romberg_tabela(x, y)
+    else:
+        raise ValueError(f"Método de integração desconhecido: {metodo!r}")
+
+    if area is None:
+        raise ValueError("Falha na integração.")
+    return {"metodo": metodo, "area": area, "erro": erro}
+
+
+
+_RESOLVEDORES = {
+    "sistema": _resolver_sistema,
+    "interpolacao": _resolver_interpolacao,
+    "integracao": _resolver_integracao,
+}
+
+# Campos que cada tipo de problema precisa informar
+_CAMPOS_OBRIGATORIOS = {
+    "sistema": ("A", "b"),
+    "interpolacao": ("x", "y", "x0"),
+    "integracao": ("x", "y"),
+}
+
+
+
+def solve_problem(problema):
+    """
+    Resolve um problema descrito por um dicionário com a chave "tipo"
+    ("sistema", "interpolacao" ou "integracao") e os dados do tipo.
+    Nunca lança exceção: retorna {"id", "tipo", "status": "ok", ...} ou
+    {"id", "tipo", "status": "erro", "mensagem"}. As mensagens que as
+    funções imprimem são capturadas, para não misturar com a saída.
+    """
+
+    tipo = problema.get("tipo")
+    resultado = {"id": problema.get("id"), "tipo": tipo}
+    mensagens = io.StringIO()
+
+    try:
+        if tipo not in _RESOLVEDORES:
+            raise ValueError(f"Tipo de problema desconhecido: {tipo!r}")
+        faltando = [campo for campo in _CAMPOS_OBRIGATORIOS[tipo] if problema.get(campo) is None]
+        if faltando:
+            raise ValueError(f"Campo(s) obrigatório(s) ausente(s) para '{tipo}': {', '.join(faltando)}")
+        with redirect_stdout(mensagens):
+            resultado.update(_RESOLVEDORES[tipo](problema))
+        resultado["status"] = "ok"
+
+    except Exception as e:
+        detalhe = mensagens.getvalue().strip()
+        resultado["status"] = "erro"
+        resultado["mensagem"] = f"{e} ({detalhe})" if detalhe else str(e)
+
+    return resultado
+
+
+
+def _tabela_numerica(caminho):
+    """Lê um CSV numérico (ignora um cabeçalho não numérico)."""
+
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        linhas = [linha for linha in csv.reader(arquivo) if linha]
+    try:
+        float(linhas[0][0])
+    except ValueError:
+        linhas = linhas[1:]
+    return np.array([[float(v) for v in linha] for linha in linhas])
+
+
+
+def _problemas_de_array(M, tipo):
+    """
+    Converte um array em problemas. Sistema: [A | b] (n × n+1) ou uma
+    pilha (m × n × n+1). Tabelas: colunas x, y (as demais colunas são
+    outras séries y sobre o mesmo x).
+    """
+
+    if tipo == "sistema":
+        pilha = M[None] if M.ndim == 2 else M
+        for Ab in pilha:
+            yield {"A": Ab[:, :-1].tolist(), "b": Ab[:, -1].tolist()}
+    else:
+        x = M[:, 0].tolist()
+        for coluna in range(1, M.shape[1]):
+            yield {"x": x, "y": M[:, coluna].tolist()}
+
+
+
+def _problemas_de_npz(dados, tipo):
+    """
+    Arquivo .npz com A e b (um sistema, ou pilhas m × n × n e m × n)
+    ou com x e y (y pode ter uma série por linha, m × k).
+    """
+
+    if "A" in dados:
+        A, b = dados["A"], dados["b"]
+        if A.ndim == 2:
+            A, b = A[None], b[None]
+        for Ai, bi in zip(A, b):
+            yield {"tipo": "sistema", "A": Ai.tolist(), "b": bi.tolist()}
+    else:
+        x, y = dados["x"].tolist(), dados["y"]
+        for yi in (y[None] if y.ndim == 1 else y):
+            yield {"tipo": tipo, "x": x, "y": yi.tolist()}
+
+
+
+def ler_problemas(caminho, tipo=None, **padroes):
+    """
+    Gera os problemas de um arquivo, um de cada vez:
+    - .json: um problema, uma lista, ou {"problemas": [...]};
+    - .jsonl: um problema por linha (lido sob demanda);
+    - .csv / .npy: uma tabela numérica, com o tipo dado por tipo;
+    - .npz: arrays A e b (sistemas) ou x e y (tabelas).
+    padroes (metodo, x0, tol, ...) completam os campos ausentes, e cada
+    problema sem "id" recebe "arquivo:índice".
+    """
+
+    nome = os.path.basename(caminho)
+    extensao = os.path.splitext(caminho)[1].lower()
+
+    if extensao == ".jsonl":
+        def origem():
+            with open(caminho, encoding="utf-8") as arquivo:
+                for linha in arquivo:
+                    if linha.strip():
+                        yield json.loads(linha)
+        problemas = origem()
+    elif extensao == ".json":
+        with open(caminho, encoding="utf-8") as arquivo:
+            dados = json.load(arquivo)
+        if isinstance(dados, dict):
+            dados = dados.get("problemas", [dados])
+        problemas = dados
+    elif extensao in (".csv", ".npy"):
+        if tipo is None:
+            raise ValueError(f"{nome}: informe o tipo do problema (--tipo) para arquivos {extensao}.")
+        M = _tabela_numerica(caminho) if extensao == ".csv" else np.load(caminho)
+        problemas = _problemas_de_array(M, tipo)
+    elif extensao == ".npz":
+        with np.load(caminho) as dados:
+            problemas = list(_problemas_de_npz(dados, tipo))
+    else:
+        raise ValueError(f"{nome}: formato não suportado ({extensao or 'sem extensão'}).")
+
+    for i, problema in enumerate(problemas):
+        completo = {"id": f"{nome}:{i}", "tipo": tipo, **padroes}
+        completo.update({k: v for k, v in problema.items() if v is not None})
+        yield completo
+
+
+
+def _json_padrao(valor):
+    """Converte tipos do numpy para JSON."""
+
+    if hasattr(valor, "tolist"):
+        return valor.tolist()
+    raise TypeError(f"Tipo não serializável: {type(valor).__name__}")
+
+
+
+def resolver_lote(problemas, saida=sys.stdout):
+    """
+    Resolve os problemas em sequência e escreve um resultado JSON por
+    linha em saida, à medida que são resolvidos.
+    Retorna (quantidade resolvida, quantidade com erro).
+    """
+
+    total = erros = 0
+    for problema in problemas:
+        resultado = solve_problem(problema)
+        saida.write(json.dumps(resultado, ensure_ascii=False, default=_json_padrao) + "\n")
+        total += 1
+        erros += resultado["status"] != "ok"
+    saida.flush()
+    return total, erros
+
+
+
+# ============================================================
+#  TEMPO DE IMPORTAÇÃO
+# ============================================================
+
+# Orçamento de importação a frio do módulo, em milissegundos
+IMPORT_BUDGET_MS = 50.0
+
+
+
+def import_report(modulo="Projeto2", budget_ms=IMPORT_BUDGET_MS, top=10):
+    """
+    Mede a importação a frio de modulo em um processo novo
+    (python -X importtime) e imprime os imports mais caros.
+    Retorna (tempo total em ms, True se ficou dentro do orçamento).
+    """
+
+    # subprocess só é necessário aqui; fora do import do módulo
+    import subprocess
+
+    try:
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+            capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+
+        # Linhas no formato "import time: self [us] | cumulative | nome",
+        # com o nome recuado conforme a profundidade na árvore de imports
+        tempos = []
+        for linha in proc.stderr.splitlines():
+            if not linha.startswith("import time:") or "cumulative" in linha:
+                continue
+            _, cumulativo, nome = linha[len("import time:"):].split("|")
+            tempos.append((int(cumulativo) / 1000, nome.rstrip()[1:]))
+
+        # O módulo pedido é o último; seus imports são as linhas recuadas
+        # imediatamente anteriores (o que vem antes é da inicialização do Python)
+        total = tempos[-1][0]
+        inicio = len(tempos) - 1
+        while inicio > 0 and tempos[inicio - 1][1].startswith(" "):
+            inicio -= 1
+        ok = total <= budget_ms
+
+        print(f"Importação de {modulo}: {total:.1f} ms (orçamento {budget_ms:.1f} ms)")
+        for ms, nome in sorted(tempos[inicio:], reverse=True)[:top]:
+            print(f"  {ms:9.1f} ms  {nome.strip()}")
+        print("Dentro do orçamento." if ok else "ACIMA do orçamento!")
+
+        return total, ok
+
+    except Exception as e:
+        print("Erro ao medir a importação:", e)
+        return None, False
+
+
+
+# Variáveis que limitam as threads do BLAS (OpenBLAS, MKL, OpenMP)
+_BLAS_THREADS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+
+def _resolver_pacote(pacote):
+    """Resolve uma lista de problemas dentro de um processo do pool."""
+
+    return [solve_problem(problema) for problema in pacote]
+
+
+
+def resolver_lote_paralelo(problemas, saida=sys.stdout, workers=None, chunksize=16, progresso=True):
+    """
+    Versão paralela de resolver_lote, com um pool de processos.
+
+    Os problemas são enviados em pacotes de chunksize (menos comunicação
+    entre processos). Uma janela de até 4 pacotes por processo fica em
+    andamento: ao concluir o pacote mais antigo, o próximo é lido e
+    enviado, de modo que os processos não ficam ociosos esperando e
+    a memória fica limitada à janela. Os resultados saem na mesma ordem
+    da entrada. Com progresso, a contagem e a vazão são mostradas na
+    saída de erro. workers=None usa todos os núcleos.
+    Retorna (quantidade resolvida, quantidade com erro).
+    """
+
+    # O pool (multiprocessing) pesa ~20 ms no import: carregado só aqui
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    problemas = iter(problemas)
+    janela = deque()
+    total = erros = 0
+    inicio = ultimo_aviso = time.perf_counter()
+
+    def enviar(pool):
+        pacote = list(islice(problemas, chunksize))
+        if pacote:
+            janela.append(pool.submit(_resolver_pacote, pacote))
+        return bool(pacote)
+
+    # Cada processo já ocupa um núcleo: o BLAS deve usar uma só thread.
+    # As variáveis só valem antes de o numpy ser importado, por isso os
+    # processos são criados do zero ("spawn") com elas já definidas, em vez
+    # de herdar por fork um numpy já carregado neste processo.
+    anteriores = {v: os.environ.get(v) for v in _BLAS_THREADS}
+    os.environ.update({v: "1" for v in _BLAS_THREADS})
+    try:
+        contexto = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=contexto) as pool:
+            while len(janela) < 4 * workers and enviar(pool):
+                pass
+
+            while janela:
+                resultados = janela.popleft().result()
+                enviar(pool)
+
+                for resultado in resultados:
+                    saida.write(json.dumps(resultado, ensure_ascii=False, default=_json_padrao) + "\n")
+                    erros += resultado["status"] != "ok"
+                total += len(resultados)
+
+                agora = time.perf_counter()
+                if progresso and (agora - ultimo_aviso >= 0.5 or not janela):
+                    ultimo_aviso = agora
+                    print(f"\r{total} problema(s) resolvido(s) ({total / (agora - inicio):.0f}/s)",
+                          end="", file=sys.stderr, flush=True)
+    finally:
+        for variavel, valor in anteriores.items():
+            if valor is None:
+                os.environ.pop(variavel, None)
+            else:
+                os.environ[variavel] = valor
+
+    if progresso and total:
+        print(file=sys.stderr)
+    saida.flush()
+    return total, erros
+
+
+
+def _lote(args):
+    """Subcomando lote: resolve os arquivos e grava os resultados."""
+
+    padroes = {"metodo": args.metodo} if args.metodo else {}
+
+    def problemas():
+        for caminho in args.arquivos:
+            for problema in ler_problemas(caminho, args.tipo, **padroes):
+                # x0 também é o chute inicial dos sistemas: só vale para interpolação
+                if args.x0 is not None and problema.get("tipo") == "interpolacao":
+                    problema.setdefault("x0", args.x0)
+                yield problema
+
+    saida = open(args.saida, "w", encoding="utf-8") if args.saida else sys.stdout
+    try:
+        if args.workers == 1:
+            total, erros = resolver_lote(problemas(), saida)
+        else:
+            total, erros = resolver_lote_paralelo(problemas(), saida, args.workers or None,
+                                                  args.chunksize, progresso=not args.silencioso)
+    except (OSError, ValueError) as e:
+        print("Erro no processamento em lote:", e, file=sys.stderr)
+        return 2
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+
+    print(f"{total} problema(s) resolvido(s), {erros} com erro.", file=sys.stderr)
+    return 1 if erros else 0
+
+
+
+def main(argv=None):
+    """
+    Ponto de entrada da linha de comando. Sem argumentos abre o menu;
+    --import-report mede o tempo de importação a frio e o subcomando
+    lote resolve arquivos de problemas sem interação.
+    """
+
+    parser = argparse.ArgumentParser(description="Aplicativo numérico (Projeto 2).")
+    parser.add_argument("--import-report", action="store_true",
+                        help="mede o tempo de importação a frio e compara com o orçamento")
+    parser.add_argument("--modulo", default="Projeto2",
+                        help="módulo medido pelo --import-report (padrão: Projeto2)")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS,
+                        help=f"orçamento em ms (padrão: {IMPORT_BUDGET_MS:g})")
+
+    comandos = parser.add_subparsers(dest="comando")
+    lote = comandos.add_parser("lote", help="resolve arquivos de problemas (JSON, JSONL, CSV, NPY, NPZ)")
+    lote.add_argument("arquivos", nargs="+", help="arquivos de problemas")
+    lote.add_argument("-o", "--saida", help="arquivo de saída JSONL (padrão: saída padrão)")
+    lote.add_argument("--tipo", choices=sorted(_RESOLVEDORES),
+                      help="tipo dos problemas (obrigatório para CSV e NPY)")
+    lote.add_argument("--metodo", help="método padrão para os problemas que não o informam")
+    lote.add_argument("--x0", type=float, help="ponto padrão dos problemas de interpolação")
+    lote.add_argument("-j", "--workers", type=int, default=1,
+                      help="processos em paralelo (padrão: 1; 0 usa todos os núcleos)")
+    lote.add_argument("--chunksize", type=int, default=16,
+                      help="problemas enviados a cada processo por vez (padrão: 16)")
+    lote.add_argument("-q", "--silencioso", action="store_true",
+                      help="não mostra o progresso da execução paralela")
+
+    args = parser.parse_args(argv)
+
+    if args.import_report:
+        _, ok = import_report(args.modulo, args.budget_ms)
+        return 0 if ok else 1
+
+    if args.comando == "lote":
+        return _lote(args)
+
+    menu()
+    return 0
+
+
+
 # Execução principal (necessário para Streamlit e execução direta)
 if __name__ == "__main__":
-    menu()
+    sys.exit(main())
@@ -1,16 +1,36 @@
+from contextlib import redirect_stdout
+from io import BytesIO, StringIO
+
 import streamlit as st
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
 from Projeto2 import (
+    lazy_import,
     gauss_elimination,
     gauss_seidel as gs_from_lib,
+    gauss_seidel_sweep,
+    IterationHistory,
+    sor,
+    conjugate_gradient,
+    is_diagonally_dominant,
+    ConvergenceMonitor,
+    choose_solver,
+    SOLVER_NAMES,
     lagrange_interp,
-    newton_interp,
+    BarycentricInterpolator,
+    NewtonPolynomial,
+    NodeIndex,
+    CubicSpline,
     trapezio_repetido,
     simpson_repetido,
+    trapezio_nao_uniforme,
+    simpson_nao_uniforme,
+    romberg_tabela,
 )
 
+# Bibliotecas pesadas carregadas só nas páginas e gráficos que as usam
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+plt = lazy_import("matplotlib.pyplot")
+
 # ===========================
 # Dark theme CSS
 # ===========================
@@ -65,43 +85,81 @@ st.markdown(DARK_CSS, unsafe_allow_html=True)
 # Helper functions
 # ===========================
 
-def is_diagonally_dominant(A):
-    """Verifica se a matriz é diagonalmente dominante"""
-    A = np.array(A, dtype=float)
-    n = len(A)
-    for i in range(n):
-        diag = abs(A[i, i])
-        soma = sum(abs(A[i, j]) for j in range(n) if j != i)
-        if diag <= soma:
-            return False, i+1
-    return True, None
-
-def gauss_seidel_with_history(A, b, x0=None, tol=1e-4, max_iter=1000):
+def gauss_seidel_with_history(A, b, x0=None, tol=1e-4, max_iter=1000, history_every=1, history_size=None, monitor=None):
+    """
+    Gauss-Seidel com histórico para os gráficos de convergência.
+    As varreduras são feitas no próprio vetor (sem cópias por iteração);
+    history_every/history_size controlam quanto do histórico é mantido.
+    O ConvergenceMonitor interrompe assim que o erro para de contrair.
+    """
     A = np.array(A, dtype=float)
     b = np.array(b, dtype=float)
     n = len(b)
     if x0 is None:
-        x = np.array([b[i] / A[i, i] for i in range(n)], dtype=float)
+        x = b / np.diagonal(A)
     else:
         x = np.array(x0, dtype=float)
 
-    history = []
+    if monitor is None:
+        monitor = ConvergenceMonitor(tol)
+    monitor.size_hint(n)
+
+    history = IterationHistory(n, every=history_every, size=history_size)
     for k in range(1, max_iter + 1):
-        x_old = x.copy()
-        for i in range(n):
-            s1 = np.dot(A[i, :i], x[:i])
-            s2 = np.dot(A[i, i+1:], x_old[i+1:])
-            x[i] = (b[i] - s1 - s2) / A[i, i]
-        err = np.max(np.abs(x - x_old))
-        history.append((k, x.copy(), err))
-        
-        # Verificar se está divergindo (valores muito grandes)
-        if np.any(np.abs(x) > 1e10):
-            return x, history, k, True  # Retorna flag de divergência
-        
+        err = gauss_seidel_sweep(A, b, x)
+
+        # Verificar se está divergindo (erro sem contrair ou valores muito grandes)
+        divergiu = monitor.update(err) or x.max() > 1e10 or x.min() < -1e10
+        history.record(k, x, err, force=divergiu or err < tol or k == max_iter)
+
+        if divergiu:
+            return x, history.entries(), k, True  # Retorna flag de divergência
+
         if err < tol:
-            return x, history, k, False
-    return x, history, max_iter, False
+            return x, history.entries(), k, False
+    return x, history.entries(), max_iter, False
+
+
+AUTO_METHOD = "Automático (escolha pela estrutura da matriz)"
+
+# Gauss-Seidel primeiro: é o método padrão da página
+ITERATIVE_METHODS = {
+    "Gauss-Seidel": None,
+    "SOR (ω automático)": None,
+    "Gradiente Conjugado (pré-condicionador Jacobi)": "jacobi",
+    "Gradiente Conjugado (pré-condicionador Cholesky incompleta)": "ic",
+    AUTO_METHOD: None,
+}
+
+def iterative_with_history(method, A, b, x0=None, tol=1e-4, max_iter=1000, monitor=None):
+    """
+    Executa o método iterativo escolhido na página da Questão 2.
+    Retorna o mesmo que gauss_seidel_with_history e mais `falha`: o
+    motivo quando o Gradiente Conjugado é interrompido (matriz não
+    positiva definida, Cholesky incompleta impossível), que não é
+    divergência; None nos demais casos.
+    """
+    if method == "Gauss-Seidel":
+        return (*gauss_seidel_with_history(A, b, x0=x0, tol=tol, max_iter=max_iter, monitor=monitor), None)
+
+    if x0 is None:
+        x0 = [b[i] / A[i][i] for i in range(len(b))]
+
+    history = IterationHistory(len(b))
+    falha = None
+    if method == "SOR (ω automático)":
+        sol, its = sor(A, b, x0, omega="auto", tol=tol, max_iter=max_iter, history=history, monitor=monitor)
+    else:
+        # A biblioteca imprime o motivo da falha; ele é capturado para a página
+        mensagens = StringIO()
+        with redirect_stdout(mensagens):
+            sol, its = conjugate_gradient(A, b, x0, tol=tol, max_iter=max_iter,
+                                          preconditioner=ITERATIVE_METHODS[method], history=history)
+        if sol is None:
+            falha = mensagens.getvalue().strip().split(": ", 1)[-1] or "falha desconhecida."
+
+    divergiu = falha is None and (sol is None or not np.all(np.isfinite(sol)))
+    return sol, history.entries(), its, divergiu, falha
 
 
 def circuit_system():
@@ -164,6 +222,253 @@ def circuit_system():
     ]
     return A, b, derivation
 
+# ===========================
+# Cache dos resultados numéricos
+# ===========================
+# Cada clique reexecuta o app inteiro; as funções abaixo guardam os
+# resultados por entrada (método, A, b, tol, ...), compartilhados entre
+# sessões, com no máximo CACHE_MAX_ENTRIES entradas (as mais antigas saem).
+
+CACHE_MAX_ENTRIES = 128
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_gauss_elimination(A, b, return_steps=False):
+    """gauss_elimination com cache."""
+    return gauss_elimination(A, b, return_steps=return_steps)
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_choose_solver(A):
+    """choose_solver com cache."""
+    return choose_solver(A)
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_iterative(method, A, b, x0, tol, max_iter):
+    """
+    iterative_with_history com cache. O ConvergenceMonitor é criado
+    aqui e devolvido junto, para a página ler fator e iterações restantes.
+    """
+    monitor = ConvergenceMonitor(tol)
+    sol, hist, its, divergiu, falha = iterative_with_history(method, A, b, x0=x0, tol=tol,
+                                                              max_iter=max_iter, monitor=monitor)
+    return sol, hist, its, divergiu, falha, monitor
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_interpolation(X, Y, x0, graus=(2, 3, 4), n_plot=200):
+    """
+    Interpolações de Lagrange/Newton com os grau+1 nós mais próximos de x0.
+    Retorna (x_plot, lista de dicts por grau com nós, valores e curva).
+    """
+    node_index = NodeIndex(X)
+    x_plot = np.linspace(min(X), max(X), n_plot)
+
+    resultados = []
+    for grau in graus:
+        if grau + 1 <= len(node_index):
+            # Selecionar pontos mais próximos (já em ordem crescente de x)
+            nos = node_index.nearest(x0, grau+1, sort_by_x=True)
+            xx = [X[i] for i in nos]
+            yy = [Y[i] for i in nos]
+
+            # Curva pelos pesos baricêntricos (calculados uma vez)
+            poly = BarycentricInterpolator(xx, yy)
+            resultados.append({
+                "grau": grau,
+                "xx": xx,
+                "yy": yy,
+                "lagrange": lagrange_interp(xx, yy, x0),
+                "newton": NewtonPolynomial(xx, yy)(x0),
+                "y_plot": poly(x_plot),
+                "interp": poly(x0),
+            })
+    return x_plot, resultados
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_spline(X, Y, x0, x_plot):
+    """Spline cúbica natural: (S(x0), S em x_plot)."""
+    spline = CubicSpline(X, Y)
+    return spline(x0), spline(x_plot)
+
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, show_spinner=False)
+def cached_integration(X, Y):
+    """
+    Áreas da Questão 4 para a tabela (X, Y): Trapézio, Simpson (ou o
+    híbrido Simpson + Trapézio com número ímpar de intervalos), as regras
+    de malha não uniforme quando for o caso, e a tabela de Romberg.
+    """
+    # Verificar espaçamento uniforme
+    h = X[1] - X[0]
+    is_uniform = all(abs(X[i+1] - X[i] - h) < 1e-6 for i in range(len(X)-1))
+
+    # Verificar se Simpson pode ser aplicado (número par de intervalos)
+    num_intervalos = len(X) - 1
+    r = {
+        "h": h,
+        "is_uniform": is_uniform,
+        "simpson_applicable": num_intervalos % 2 == 0,
+        "A_simp": None,
+        "A_simp_partial": None,
+        "A_trap_last": None,
+        "romberg": None,
+    }
+
+    if not is_uniform:
+        # Malha irregular: regras com Δxᵢ próprio, sem reamostrar os dados
+        r["A_trap"] = trapezio_nao_uniforme(X, Y)
+        r["A_simp"] = simpson_nao_uniforme(X, Y)
+        return r
+
+    # Calcular área da meia-seção
+    r["A_trap"] = trapezio_repetido(X, Y)
+
+    if r["simpson_applicable"]:
+        r["A_simp"] = simpson_repetido(X, Y)
+    elif len(X) >= 3:
+        # Número ímpar de intervalos: Simpson nos primeiros n-1 intervalos
+        # e Trapézio no último (método híbrido)
+        r["A_simp_partial"] = simpson_repetido(X[:-1], Y[:-1])
+        if r["A_simp_partial"] is not None:
+            h_last = X[-1] - X[-2]
+            r["A_trap_last"] = h_last * (Y[-2] + Y[-1]) / 2
+            r["A_simp"] = r["A_simp_partial"] + r["A_trap_last"]
+
+    r["romberg"] = romberg_tabela(X, Y)
+    return r
+
+# ===========================
+# Figuras em cache
+# ===========================
+# Cada gráfico é desenhado uma vez por conjunto de dados e guardado como
+# PNG; a figura do matplotlib é fechada logo após salvar, para que as
+# reexecuções não acumulem figuras abertas.
+
+FIGURE_CACHE_MAX_ENTRIES = 32
+
+def figure_png(fig, dpi=100):
+    """Salva a figura em bytes PNG e a fecha."""
+    buffer = BytesIO()
+    try:
+        fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    finally:
+        plt.close(fig)
+    return buffer.getvalue()
+
+
+@st.cache_data(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def convergence_figure(hist, tol):
+    """Correntes e erro por iteração (Questão 2)."""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+    
+    # Gráfico das correntes
+    for j in range(len(hist[0][1])):
+        valores = [h[1][j] for h in hist]
+        # Limitar valores para visualização se estiverem muito grandes
+        if max(abs(v) for v in valores) > 1e6:
+            ax1.text(0.5, 0.5, 'Valores divergindo\ndemais para visualizar', 
+                    transform=ax1.transAxes, ha='center', va='center', fontsize=12)
+        else:
+            ax1.plot([h[0] for h in hist], valores, 
+                    label=f"i{j+1}", marker='o', markersize=3)
+    ax1.set_xlabel('Iteração')
+    ax1.set_ylabel('Corrente (A)')
+    ax1.set_title('Convergência das Correntes')
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    
+    # Gráfico do erro
+    erros = [h[2] for h in hist]
+    if max(erros) > 1e6:
+        ax2.text(0.5, 0.5, 'Erro divergindo\ndemais para visualizar', 
+                transform=ax2.transAxes, ha='center', va='center', fontsize=12)
+    else:
+        ax2.semilogy([h[0] for h in hist], erros, 'r-', linewidth=2)
+        ax2.axhline(y=tol, color='g', linestyle='--', label=f'Tolerância ({tol})')
+    ax2.set_xlabel('Iteração')
+    ax2.set_ylabel('Erro (escala log)')
+    ax2.set_title('Convergência do Erro')
+    ax2.legend()
+    ax2.grid(True, alpha=0.3)
+    
+    fig.tight_layout()
+    return figure_png(fig)
+
+
+@st.cache_data(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def interpolation_data_figure(X, Y):
+    """Pontos experimentais da Questão 3."""
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.scatter(X, Y, s=100, c='red', zorder=5, label='Pontos conhecidos')
+    ax.axvline(x=1.15, color='green', linestyle='--', label='Valor a interpolar (i=1.15)')
+    ax.set_xlabel('Corrente i (A)')
+    ax.set_ylabel('Tensão V (V)')
+    ax.set_title('Dados Experimentais')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    return figure_png(fig)
+
+
+@st.cache_data(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def interpolation_figure(X, Y, x0, x_plot, curvas):
+    """Polinômios de grau 2, 3 e 4 (curvas de cached_interpolation)."""
+    fig, axes = plt.subplots(1, 3, figsize=(18, 5))
+    
+    for idx, c in enumerate(curvas):
+        grau, xx, yy = c["grau"], c["xx"], c["yy"]
+        
+        ax = axes[idx]
+        ax.scatter(X, Y, s=100, c='red', zorder=5, label='Pontos conhecidos')
+        ax.scatter(xx, yy, s=150, c='blue', marker='s', zorder=6, label='Pontos usados')
+        ax.plot(x_plot, c["y_plot"], 'b-', linewidth=2, label=f'Polinômio grau {grau}')
+        ax.axvline(x=x0, color='green', linestyle='--', linewidth=2, label=f'i = {x0}')
+        
+        # Valor interpolado
+        val_interp = c["interp"]
+        ax.plot(x0, val_interp, 'go', markersize=10, zorder=7, label=f'V({x0}) = {val_interp:.4f}')
+        
+        ax.set_xlabel('Corrente i (A)')
+        ax.set_ylabel('Tensão V (V)')
+        ax.set_title(f'Interpolação de Grau {grau}')
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+    
+    fig.tight_layout()
+    return figure_png(fig)
+
+
+@st.cache_data(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def spline_figure(X, Y, x0, x_plot, y_spline, val_spline):
+    """Spline cúbica natural sobre todos os pontos."""
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.scatter(X, Y, s=100, c='red', zorder=5, label='Pontos conhecidos')
+    ax.plot(x_plot, y_spline, 'm-', linewidth=2, label='Spline cúbica natural')
+    ax.axvline(x=x0, color='green', linestyle='--', linewidth=2, label=f'i = {x0}')
+    ax.plot(x0, val_spline, 'go', markersize=10, zorder=7, label=f'S({x0}) = {val_spline:.4f}')
+    ax.set_xlabel('Corrente i (A)')
+    ax.set_ylabel('Tensão V (V)')
+    ax.set_title('Spline Cúbica Natural')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    return figure_png(fig)
+
+
+@st.cache_data(max_entries=FIGURE_CACHE_MAX_ENTRIES, show_spinner=False)
+def ship_profile_figure(X, Y):
+    """Perfil da meia-seção do navio (Questão 4)."""
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.barh(X, Y, height=0.3, alpha=0.6, color='blue', label='Meia-largura')
+    ax.plot(Y, X, 'ro-', linewidth=2, markersize=8, label='Perfil do casco')
+    ax.set_xlabel('Meia-largura (m)')
+    ax.set_ylabel('Profundidade (m)')
+    ax.set_title('Perfil da Seção do Navio (meia-seção)')
+    ax.legend()
+    ax.grid(True, alpha=0.3)
+    ax.invert_yaxis()
+    return figure_png(fig)
+
 # ===========================
 # UI
 # ===========================
@@ -353,7 +658,7 @@ if page == "1️⃣ Questão 1 — Sistemas Lineares (Gauss)":
                 st.error("⚠️ Por favor, preencha todos os valores da matriz A (3x3) e do vetor b (3 valores).")
             else:
                 if show_steps:
-                    sol, steps = gauss_elimination(A, b, return_steps=True)
+                    sol, steps = cached_gauss_elimination(A, b, return_steps=True)
                     if sol is None:
                         st.error("❌ Sistema singular ou erro na resolução.")
                     else:
@@ -382,7 +687,7 @@ if page == "1️⃣ Questão 1 — Sistemas Lineares (Gauss)":
                         st.write(f"**Resíduo (Ax - b):** {residual}")
                         st.write(f"**Norma do resíduo:** {np.linalg.norm(residual):.2e}")
                 else:
-                    sol = gauss_elimination(A, b)
+                    sol = cached_gauss_elimination(A, b)
                     if sol is None:
                         st.error("❌ Sistema singular ou erro na resolução.")
                     else:
@@ -499,12 +804,29 @@ if page == "2️⃣ Questão 2 — Circuito Elétrico (Gauss-Seidel)":
         </div>
         """, unsafe_allow_html=True)
     
+    with st.expander("📖 Alternativas: SOR e Gradiente Conjugado", expanded=False):
+        st.markdown("""
+        <div class='card'>
+        <h4>SOR (Successive Over-Relaxation)</h4>
+        <p>Combina o valor antigo com o valor de Gauss-Seidel usando um fator ω:</p>
+        <div class='formula-box'>
+        xᵢ⁽ᵏ⁺¹⁾ = (1 - ω)·xᵢ⁽ᵏ⁾ + ω·xᵢ(Gauss-Seidel)
+        </div>
+        <p>O ω ótimo é estimado pelo raio espectral ρ da matriz de Jacobi: ω = 2 / (1 + √(1 - ρ²)).</p>
+        <h4>Gradiente Conjugado</h4>
+        <p>Para matrizes simétricas positivas definidas (como a matriz de malhas do circuito), 
+        o Gradiente Conjugado converge em O(√κ) iterações, onde κ é o número de condição. 
+        Pré-condicionadores (Jacobi ou Cholesky incompleta) reduzem κ e aceleram ainda mais.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
     # Configuração
     st.markdown("---")
     st.subheader("⚙️ Passo 3: Configuração do Método")
     
     col1, col2 = st.columns(2)
     with col1:
+        metodo_it = st.selectbox("Método iterativo", list(ITERATIVE_METHODS))
         tol = st.number_input("Tolerância (erro máximo)", value=0.0001, format="%.6f", step=0.0001)
         max_it = st.number_input("Máximo de iterações", min_value=10, value=1000, step=10)
     
@@ -528,22 +850,49 @@ if page == "2️⃣ Questão 2 — Circuito Elétrico (Gauss-Seidel)":
         st.info("💡 **Solução alternativa:** Se o método não convergir, será usada a eliminação de Gauss para obter a solução exata.")
     
     # Resolução
-    if st.button("🚀 Resolver pelo Método de Gauss-Seidel", type="primary"):
+    if st.button(f"🚀 Resolver pelo Método {metodo_it}", type="primary"):
         try:
-            sol, hist, its, divergiu = gauss_seidel_with_history(A_circ, b_circ, x0=x0, tol=tol, max_iter=int(max_it))
+            # Escolha automática: decide o método antes de gastar iterações
+            direto = False
+            if metodo_it == AUTO_METHOD:
+                escolhido, motivo = cached_choose_solver(A_circ)
+                st.info(f"🤖 **Método escolhido:** {SOLVER_NAMES[escolhido]}\n\n**Motivo:** {motivo}")
+                if escolhido == "lu":
+                    direto = True
+                else:
+                    metodo_it = SOLVER_NAMES[escolhido]
+            
+            if direto:
+                sol, hist, its, divergiu, falha = cached_gauss_elimination(A_circ, b_circ), [], None, False, None
+            else:
+                sol, hist, its, divergiu, falha, monitor = cached_iterative(metodo_it, A_circ, b_circ, x0, tol, int(max_it))
             
             # Se divergiu ou não convergiu, usar eliminação de Gauss
-            usar_gauss = False
-            if divergiu or (its >= max_it and hist[-1][2] >= tol):
-                st.error(f"❌ **Método de Gauss-Seidel não convergiu!**")
-                if divergiu:
-                    st.error("O método está divergindo (valores crescendo exponencialmente).")
+            usar_gauss = direto
+            if direto:
+                if sol is not None:
+                    st.success("✅ Solução obtida diretamente pela eliminação de Gauss!")
+            elif falha or divergiu or (its >= max_it and hist[-1][2] >= tol):
+                if falha:
+                    st.error(f"❌ **Método {metodo_it} interrompido:** {falha}")
+                elif divergiu:
+                    st.error(f"❌ **Método {metodo_it} não convergiu!**")
+                    if monitor.factor is not None:
+                        st.error(f"O método está divergindo: fator de contração estimado ρ ≈ {monitor.factor:.4f} ≥ 1 "
+                                 f"(interrompido na iteração {monitor.iterations}).")
+                    else:
+                        st.error("O método está divergindo (valores crescendo exponencialmente).")
                 else:
+                    st.error(f"❌ **Método {metodo_it} não convergiu!**")
                     st.warning(f"⚠️ Não convergiu em {max_it} iterações. Erro final: {hist[-1][2]:.6e}")
+                    restantes = monitor.remaining()
+                    if restantes:
+                        st.info(f"⏱️ Com ρ ≈ {monitor.factor:.4f}, seriam necessárias cerca de "
+                                f"{restantes} iterações adicionais para atingir a tolerância.")
                 
                 st.info("🔄 **Usando eliminação de Gauss para obter a solução exata...**")
                 usar_gauss = True
-                sol_gauss = gauss_elimination(A_circ, b_circ)
+                sol_gauss = cached_gauss_elimination(A_circ, b_circ)
                 if sol_gauss is not None:
                     sol = sol_gauss
                     st.success("✅ Solução obtida pelo método de eliminação de Gauss!")
@@ -552,6 +901,9 @@ if page == "2️⃣ Questão 2 — Circuito Elétrico (Gauss-Seidel)":
                     sol = None
             else:
                 st.success(f"✅ Convergência alcançada em {its} iterações!")
+                if monitor.factor is not None:
+                    st.caption(f"Fator de contração assintótico estimado: ρ ≈ {monitor.factor:.4f} "
+                               f"(o erro cai ~{(1 - monitor.factor):.0%} por iteração).")
             
             # Verificar se temos solução válida
             if sol is None:
@@ -591,40 +943,7 @@ if page == "2️⃣ Questão 2 — Circuito Elétrico (Gauss-Seidel)":
                     
                     # Gráfico de convergência
                     st.markdown("### 📈 Gráficos de Convergência")
-                    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-                    
-                    # Gráfico das correntes
-                    for j in range(len(sol)):
-                        valores = [h[1][j] for h in hist]
-                        # Limitar valores para visualização se estiverem muito grandes
-                        if max(abs(v) for v in valores) > 1e6:
-                            ax1.text(0.5, 0.5, 'Valores divergindo\ndemais para visualizar', 
-                                    transform=ax1.transAxes, ha='center', va='center', fontsize=12)
-                        else:
-                            ax1.plot([h[0] for h in hist], valores, 
-                                    label=f"i{j+1}", marker='o', markersize=3)
-                    ax1.set_xlabel('Iteração')
-                    ax1.set_ylabel('Corrente (A)')
-                    ax1.set_title('Convergência das Correntes')
-                    ax1.legend()
-                    ax1.grid(True, alpha=0.3)
-                    
-                    # Gráfico do erro
-                    erros = [h[2] for h in hist]
-                    if max(erros) > 1e6:
-                        ax2.text(0.5, 0.5, 'Erro divergindo\ndemais para visualizar', 
-                                transform=ax2.transAxes, ha='center', va='center', fontsize=12)
-                    else:
-                        ax2.semilogy([h[0] for h in hist], erros, 'r-', linewidth=2)
-                        ax2.axhline(y=tol, color='g', linestyle='--', label=f'Tolerância ({tol})')
-                    ax2.set_xlabel('Iteração')
-                    ax2.set_ylabel('Erro (escala log)')
-                    ax2.set_title('Convergência do Erro')
-                    ax2.legend()
-                    ax2.grid(True, alpha=0.3)
-                    
-                    plt.tight_layout()
-                    st.pyplot(fig)
+                    st.image(convergence_figure(hist, tol))
 
                 # Interpretação
                 st.markdown("### 💡 Interpretação dos Resultados")
@@ -639,7 +958,7 @@ if page == "2️⃣ Questão 2 — Circuito Elétrico (Gauss-Seidel)":
                     - **i₄ = {sol[3]:.4f} A** ({sol[3]*1000:.2f} mA)
                     - **i₅ = {sol[4]:.4f} A** ({sol[4]*1000:.2f} mA)
                     
-                    **Nota:** O método de Gauss-Seidel não convergiu porque a matriz não é diagonalmente dominante.
+                    **Nota:** {"A eliminação de Gauss foi escolhida antes de iterar, pois é o método mais barato para esta matriz." if direto else f"O método {metodo_it} não convergiu para esta matriz (por exemplo, por não ser diagonalmente dominante ou positiva definida)."}
                     A eliminação de Gauss fornece a solução exata do sistema.
                     """)
                 else:
@@ -725,15 +1044,7 @@ if page == "3️⃣ Questão 3 — Interpolação Polinomial":
     
     if X and Y and len(X) == len(Y) and len(X) >= 2:
         # Visualização dos dados
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.scatter(X, Y, s=100, c='red', zorder=5, label='Pontos conhecidos')
-        ax.axvline(x=1.15, color='green', linestyle='--', label='Valor a interpolar (i=1.15)')
-        ax.set_xlabel('Corrente i (A)')
-        ax.set_ylabel('Tensão V (V)')
-        ax.set_title('Dados Experimentais')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        st.pyplot(fig)
+        st.image(interpolation_data_figure(X, Y))
     
     # Valor a interpolar
     st.markdown("---")
@@ -774,45 +1085,42 @@ if page == "3️⃣ Questão 3 — Interpolação Polinomial":
             </div>
             """, unsafe_allow_html=True)
     
+    with st.expander("📖 Spline Cúbica"):
+        st.markdown("""
+        <div class='card'>
+        <h4>Spline Cúbica</h4>
+        <p>Em vez de um único polinômio de grau alto, usa um polinômio cúbico em cada intervalo [xᵢ, xᵢ₊₁], 
+        com primeira e segunda derivadas contínuas nos nós:</p>
+        <div class='formula-box'>
+        Sᵢ(x) = yᵢ + bᵢ(x-xᵢ) + cᵢ(x-xᵢ)² + dᵢ(x-xᵢ)³
+        </div>
+        <p>As segundas derivadas nos nós vêm de um sistema tridiagonal (algoritmo de Thomas, O(n)). 
+        Na spline <strong>natural</strong>, S'' = 0 nas extremidades. Evita o fenômeno de Runge em tabelas grandes.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    usar_spline = st.checkbox("🧵 Incluir spline cúbica natural (usa todos os pontos)", value=False)
+    
     # Resolução
     st.markdown("---")
     st.subheader("🧮 Passo 4: Resolução")
     
     if st.button("🚀 Calcular Interpolação", type="primary") and X and Y:
         try:
-            # Ordenar pontos por proximidade ao valor a interpolar
-            pairs = list(zip(X, Y))
-            pairs.sort(key=lambda p: abs(p[0] - x0))
+            # Nós mais próximos de x0, valores e curvas de cada grau (com cache)
+            x_plot, curvas = cached_interpolation(X, Y, x0)
             
             results = []
-            
-            for grau in [2, 3, 4]:
-                if grau + 1 <= len(pairs):
-                    # Selecionar pontos mais próximos
-                    xx, yy = zip(*pairs[:grau+1])
-                    xx = list(xx)
-                    yy = list(yy)
-                    
-                    # Ordenar por x para melhor visualização
-                    sorted_pairs = sorted(zip(xx, yy))
-                    xx, yy = zip(*sorted_pairs)
-                    xx = list(xx)
-                    yy = list(yy)
-                    
-                    # Lagrange
-                    val_lagrange = lagrange_interp(xx, yy, x0)
-                    
-                    # Newton
-                    val_newton, dd = newton_interp(xx, yy, x0)
-                    
-                    results.append({
-                        "Grau": grau,
-                        "Pontos usados": f"{len(xx)} pontos",
-                        "Pontos (i)": [f"{x:.2f}" for x in xx],
-                        "Lagrange": f"{val_lagrange:.6f}",
-                        "Newton": f"{val_newton:.6f}" if val_newton else "Erro",
-                        "Diferença": f"{abs(val_lagrange - val_newton):.2e}" if val_newton else "N/A"
-                    })
+            for c in curvas:
+                val_lagrange, val_newton = c["lagrange"], c["newton"]
+                results.append({
+                    "Grau": c["grau"],
+                    "Pontos usados": f"{len(c['xx'])} pontos",
+                    "Pontos (i)": [f"{x:.2f}" for x in c["xx"]],
+                    "Lagrange": f"{val_lagrange:.6f}",
+                    "Newton": f"{val_newton:.6f}" if val_newton else "Erro",
+                    "Diferença": f"{abs(val_lagrange - val_newton):.2e}" if val_newton else "N/A"
+                })
             
             # Tabela de resultados
             st.markdown("### ✅ Resultados da Interpolação")
@@ -822,38 +1130,15 @@ if page == "3️⃣ Questão 3 — Interpolação Polinomial":
             # Visualização
             st.markdown("### 📊 Visualização dos Polinômios Interpoladores")
             
-            # Gerar pontos para plotagem
-            x_plot = np.linspace(min(X), max(X), 200)
-            
-            fig, axes = plt.subplots(1, 3, figsize=(18, 5))
+            st.image(interpolation_figure(X, Y, x0, x_plot, curvas))
             
-            for idx, grau in enumerate([2, 3, 4]):
-                if grau + 1 <= len(pairs):
-                    xx, yy = zip(*pairs[:grau+1])
-                    xx = sorted(list(xx))
-                    yy = [Y[X.index(x)] for x in xx]
-                    
-                    # Calcular valores interpolados
-                    y_plot = [lagrange_interp(xx, yy, xp) for xp in x_plot]
-                    
-                    ax = axes[idx]
-                    ax.scatter(X, Y, s=100, c='red', zorder=5, label='Pontos conhecidos')
-                    ax.scatter(xx, yy, s=150, c='blue', marker='s', zorder=6, label='Pontos usados')
-                    ax.plot(x_plot, y_plot, 'b-', linewidth=2, label=f'Polinômio grau {grau}')
-                    ax.axvline(x=x0, color='green', linestyle='--', linewidth=2, label=f'i = {x0}')
-                    
-                    # Valor interpolado
-                    val_interp = lagrange_interp(xx, yy, x0)
-                    ax.plot(x0, val_interp, 'go', markersize=10, zorder=7, label=f'V({x0}) = {val_interp:.4f}')
-                    
-                    ax.set_xlabel('Corrente i (A)')
-                    ax.set_ylabel('Tensão V (V)')
-                    ax.set_title(f'Interpolação de Grau {grau}')
-                    ax.legend()
-                    ax.grid(True, alpha=0.3)
-            
-            plt.tight_layout()
-            st.pyplot(fig)
+            # Spline cúbica natural sobre todos os pontos
+            if usar_spline:
+                st.markdown("### 🧵 Spline Cúbica Natural")
+                val_spline, y_spline = cached_spline(X, Y, x0, x_plot)
+                st.metric(f"V({x0}) pela spline cúbica natural", f"{val_spline:.6f} V")
+                
+                st.image(spline_figure(X, Y, x0, x_plot, y_spline, val_spline))
             
             # Interpretação
             st.markdown("### 💡 Interpretação dos Resultados")
@@ -933,16 +1218,7 @@ if page == "4️⃣ Questão 4 — Integração Numérica":
     
     if X and Y and len(X) == len(Y):
         # Visualização
-        fig, ax = plt.subplots(figsize=(10, 6))
-        ax.barh(X, Y, height=0.3, alpha=0.6, color='blue', label='Meia-largura')
-        ax.plot(Y, X, 'ro-', linewidth=2, markersize=8, label='Perfil do casco')
-        ax.set_xlabel('Meia-largura (m)')
-        ax.set_ylabel('Profundidade (m)')
-        ax.set_title('Perfil da Seção do Navio (meia-seção)')
-        ax.legend()
-        ax.grid(True, alpha=0.3)
-        ax.invert_yaxis()
-        st.pyplot(fig)
+        st.image(ship_profile_figure(X, Y))
         
         # Tabela
         df_data = pd.DataFrame({
@@ -994,45 +1270,19 @@ if page == "4️⃣ Questão 4 — Integração Numérica":
             st.error("⚠️ Os vetores X e Y devem ter o mesmo tamanho!")
         else:
             try:
-                # Verificar espaçamento uniforme
-                h = X[1] - X[0]
-                is_uniform = all(abs(X[i+1] - X[i] - h) < 1e-6 for i in range(len(X)-1))
+                # Áreas por todas as regras (com cache por tabela X, Y)
+                r = cached_integration(X, Y)
+                h, is_uniform, simpson_applicable = r["h"], r["is_uniform"], r["simpson_applicable"]
+                A_trap, A_simp = r["A_trap"], r["A_simp"]
+                A_simp_partial, A_trap_last = r["A_simp_partial"], r["A_trap_last"]
                 
                 if not is_uniform:
-                    st.warning("⚠️ Espaçamento não uniforme detectado. Os métodos podem não funcionar corretamente.")
-                
-                # Calcular área da meia-seção
-                A_trap = trapezio_repetido(X, Y)
-                
-                # Verificar se Simpson pode ser aplicado (número par de intervalos)
-                num_intervalos = len(X) - 1
-                A_simp = None
-                simpson_applicable = (num_intervalos % 2 == 0)
-                A_simp_partial = None
-                A_trap_last = None
-                
-                if simpson_applicable:
-                    A_simp = simpson_repetido(X, Y)
-                else:
-                    # Se número ímpar de intervalos, usar Simpson nos primeiros n-1 intervalos
-                    # e Trapézio no último intervalo (método híbrido)
-                    if len(X) >= 3:
-                        # Usar Simpson nos primeiros pontos (número par de intervalos)
-                        # Remover o último ponto para ter número par de intervalos
-                        X_simp = X[:-1]
-                        Y_simp = Y[:-1]
-                        A_simp_partial = simpson_repetido(X_simp, Y_simp)
-                        
-                        # Adicionar área do último trapézio
-                        if A_simp_partial is not None:
-                            h_last = X[-1] - X[-2]
-                            A_trap_last = h_last * (Y[-2] + Y[-1]) / 2
-                            A_simp = A_simp_partial + A_trap_last
+                    st.info("ℹ️ Espaçamento não uniforme detectado: foram usadas as regras do Trapézio e de Simpson para malha não uniforme.")
                 
                 if A_trap is None:
                     st.error("❌ Erro no cálculo pela regra do Trapézio")
                 
-                if not simpson_applicable and A_simp is not None:
+                if is_uniform and not simpson_applicable and A_simp is not None:
                     st.info("ℹ️ **Nota:** Como há número ímpar de intervalos, foi usado Simpson nos primeiros intervalos e Trapézio no último intervalo (método híbrido).")
                 elif A_simp is None:
                     st.warning("⚠️ Não foi possível calcular pela regra de Simpson (número ímpar de intervalos e método híbrido não aplicável)")
@@ -1065,17 +1315,32 @@ if page == "4️⃣ Questão 4 — Integração Numérica":
                     st.markdown("### 📝 Detalhamento dos Cálculos")
                     
                     st.markdown("#### Regra do Trapézio Repetida")
-                    st.code(f"""
+                    if not is_uniform:
+                        st.code(f"""
+Malha não uniforme: hᵢ = xᵢ₊₁ - xᵢ
+Área = Σ hᵢ × (yᵢ + yᵢ₊₁) / 2
+     = {A_trap:.6f} m² (meia-seção)
+     = {A_trap_total:.6f} m² (seção completa)
+                        """)
+                    else:
+                        st.code(f"""
 h = {h:.2f} m
 Área = (h/2) × [y₀ + 2(y₁ + y₂ + ... + yₙ₋₁) + yₙ]
      = ({h:.2f}/2) × [{Y[0]:.2f} + 2({sum(Y[1:-1]):.2f}) + {Y[-1]:.2f}]
      = {A_trap:.6f} m² (meia-seção)
      = {A_trap_total:.6f} m² (seção completa)
-                    """)
+                        """)
                     
                     st.markdown("#### Regra de Simpson Repetida")
                     if A_simp:
-                        if simpson_applicable:
+                        if not is_uniform:
+                            st.code(f"""
+Malha não uniforme: para cada par de intervalos (h₀, h₁)
+Área = Σ (h₀+h₁)/6 × [(2 - h₁/h₀)y₀ + (h₀+h₁)²/(h₀h₁)·y₁ + (2 - h₀/h₁)y₂]
+     = {A_simp:.6f} m² (meia-seção)
+     = {2 * A_simp:.6f} m² (seção completa)
+                            """)
+                        elif simpson_applicable:
                             # Simpson aplicado diretamente
                             st.code(f"""
 h = {h:.2f} m
@@ -1095,6 +1360,40 @@ Método Híbrido (Simpson + Trapézio):
                     else:
                         st.warning("⚠️ Simpson não pôde ser aplicado (número ímpar de intervalos)")
                     
+                    # Romberg: só com malha uniforme e ao menos um nível de 2h
+                    if r["romberg"] is not None:
+                        A_romb, erro_romb, tabela_romb = r["romberg"]
+                        if A_romb is not None and len(tabela_romb) >= 2:
+                            st.markdown("#### Extrapolação de Romberg")
+                            n_niveis = len(tabela_romb)
+                            passos = [h * 2**(n_niveis - 1 - i) for i in range(n_niveis)]
+                            df_romb = pd.DataFrame(
+                                [linha + [None] * (n_niveis - len(linha)) for linha in tabela_romb],
+                                index=[f"h = {p:.2f}" for p in passos],
+                                columns=[f"R(k, {j})" for j in range(n_niveis)],
+                            )
+                            st.dataframe(df_romb, use_container_width=True)
+                            st.metric(
+                                "Área meia-seção (Romberg)",
+                                f"{A_romb:.6f} m²",
+                                f"erro estimado {erro_romb:.2e} m²",
+                                delta_color="off",
+                            )
+                            st.caption(
+                                "A primeira coluna são trapézios com passo h, 2h, 4h, ... "
+                                "(tomando um ponto sim, outro não); cada coluna seguinte aplica "
+                                "Richardson, R(k, j) = R(k, j-1) + [R(k, j-1) - R(k-1, j-1)] / (4ʲ - 1). "
+                                "R(k, 1) coincide com Simpson; as colunas seguintes eliminam termos "
+                                "de erro O(h⁶), O(h⁸), ..."
+                            )
+                        elif A_romb is not None:
+                            st.markdown("#### Extrapolação de Romberg")
+                            st.caption(
+                                f"Não aplicada: com {len(X) - 1} intervalos (número ímpar) não há malha "
+                                "com passo 2h dentro da tabela, e Romberg precisa de ao menos dois níveis. "
+                                "Use um número par de intervalos para ver a tabela de Richardson."
+                            )
+                    
                     # Comparação
                     if A_simp:
                         st.markdown("### 📊 Comparação dos Métodos")